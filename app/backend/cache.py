@@ -0,0 +1,194 @@
+"""
+Response caching for the read-only API endpoints.
+
+The dataset is static for the lifetime of a deploy, so responses are cached
+with a long TTL and never invalidated:
+  - server side in Redis (opt-in: set REDIS_URL, e.g. redis://localhost:6379/0;
+    otherwise every request falls through to the store as before)
+  - client side via ETag / If-None-Match revalidation (ETagMiddleware)
+"""
+import functools
+import hashlib
+import inspect
+import os
+
+import orjson
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+from starlette.datastructures import Headers, MutableHeaders, QueryParams
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # redis is only needed when REDIS_URL is set
+    redis = None
+
+
+class RedisCache:
+    def __init__(self, url: str | None = None, max_connections: int = 20, version: str = ""):
+        self.url = url
+        self.max_connections = max_connections
+        # Dataset/code version (store.version) baked into every key, so a
+        # rebuild misses instead of serving bodies cached from the old data.
+        self.version = version
+        self.pool = None
+        self.client = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.client is not None
+
+    async def connect(self):
+        self.url = self.url or os.environ.get("REDIS_URL")
+        if not self.url:
+            return
+        if redis is None:
+            print("[cache] REDIS_URL is set but the redis package is not installed; caching disabled")
+            return
+        try:
+            self.pool = redis.ConnectionPool.from_url(self.url, max_connections=self.max_connections)
+            self.client = redis.Redis(connection_pool=self.pool)
+            await self.client.ping()
+        except Exception as e:
+            # Keep serving uncached responses if Redis is down.
+            print(f"[cache] redis unavailable at {self.url}: {e}")
+            await self.disconnect()
+
+    async def disconnect(self):
+        if self.client is not None:
+            await self.client.aclose()
+        if self.pool is not None:
+            await self.pool.disconnect()
+        self.client = None
+        self.pool = None
+
+    async def get(self, key: str) -> bytes | None:
+        if self.client is None:
+            return None
+        try:
+            return await self.client.get(key)
+        except Exception as e:
+            print(f"[cache] get failed for {key}: {e}")
+            return None
+
+    async def setex(self, key: str, expire: int, value: bytes):
+        if self.client is None:
+            return
+        try:
+            await self.client.setex(key, expire, value)
+        except Exception as e:
+            print(f"[cache] setex failed for {key}: {e}")
+
+
+cache = RedisCache()
+
+# One TypeAdapter per response model, built on first use.
+_adapters: dict[object, TypeAdapter] = {}
+
+
+def _cache_key(prefix: str, request: Request) -> str:
+    query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+    digest = hashlib.sha1(f"{request.url.path}?{query}".encode()).hexdigest()
+    return f"nba:{cache.version}:{prefix}:{digest}"
+
+
+def _render(request: Request, result) -> bytes:
+    """Serialize a handler result the same way FastAPI would for its route."""
+    if isinstance(result, Response):
+        return result.body
+    route = request.scope.get("route")
+    model = getattr(route, "response_model", None)
+    if model is None:
+        return orjson.dumps(jsonable_encoder(result))
+    adapter = _adapters.get(model)
+    if adapter is None:
+        adapter = _adapters[model] = TypeAdapter(model)
+    return adapter.dump_json(adapter.validate_python(result))
+
+
+def cached(prefix: str, expire: int = 86400):
+    """
+    Cache a JSON endpoint's serialized body in Redis under a key derived from
+    the request path and sorted query params. Apply below the @app.get(...)
+    decorator so the route's response_model is still used for the schema.
+    """
+
+    def decorator(func):
+        sig = inspect.signature(func)
+        wants_request = "request" in sig.parameters
+
+        @functools.wraps(func)
+        async def wrapper(*args, request: Request, **kwargs):
+            if wants_request:
+                kwargs["request"] = request
+
+            async def call():
+                if inspect.iscoroutinefunction(func):
+                    return await func(*args, **kwargs)
+                return await run_in_threadpool(func, *args, **kwargs)
+
+            if not cache.enabled:
+                return await call()
+
+            key = _cache_key(prefix, request)
+            hit = await cache.get(key)
+            if hit is not None:
+                return Response(content=hit, media_type="application/json")
+            body = _render(request, await call())
+            await cache.setex(key, expire, body)
+            return Response(content=body, media_type="application/json")
+
+        # Expose `request` to FastAPI's dependency injection even if the
+        # wrapped handler doesn't declare it.
+        params = list(sig.parameters.values())
+        if not wants_request:
+            params.append(inspect.Parameter("request", inspect.Parameter.KEYWORD_ONLY, annotation=Request))
+        wrapper.__signature__ = sig.replace(parameters=params)
+        return wrapper
+
+    return decorator
+
+
+class ETagMiddleware:
+    """
+    Weak ETags for JSON GET endpoints whose output depends only on the URL and
+    the dataset version. A matching If-None-Match is answered with a bodyless
+    304 before any handler runs; 200 responses get ETag and Cache-Control.
+    """
+
+    def __init__(self, app, version: str, prefixes: tuple[str, ...] = ("/player", "/labels"), max_age: int = 86400):
+        self.app = app
+        self.version = version
+        self.prefixes = prefixes
+        self.cache_control = f"public, max-age={max_age}"
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or scope["method"] not in ("GET", "HEAD")
+            or not scope["path"].startswith(self.prefixes)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        query = sorted(QueryParams(scope.get("query_string", b"")).multi_items())
+        digest = hashlib.sha1(f"{scope['path']}?{query}".encode()).hexdigest()[:16]
+        etag = f'W/"{self.version}-{digest}"'
+
+        # Only an ETag this middleware handed out (on a 200) revalidates; "*"
+        # would also match ids that 404/422, so it falls through to the handler.
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+            response = Response(status_code=304, headers={"ETag": etag, "Cache-Control": self.cache_control})
+            await response(scope, receive, send)
+            return
+
+        async def send_with_etag(message):
+            if message["type"] == "http.response.start" and message["status"] == 200:
+                headers = MutableHeaders(scope=message)
+                headers["ETag"] = etag
+                headers["Cache-Control"] = self.cache_control
+            await send(message)
+
+        await self.app(scope, receive, send_with_etag)
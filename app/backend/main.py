@@ -1,7 +1,14 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+import asyncio
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, HTMLResponse
+from .cache import ETagMiddleware, cache, cached
 from .store import store
 from .schemas import (
+    PlayerListAdapter,
     PlayerListItem,
     TrajectoryPoint,
     SimilarPlayer,
@@ -11,144 +18,145 @@ from .schemas import (
     RadarResponse,
     CountingGeometryResponse,
     ForecastPoint,
+    PlayerBundle,
 )
 
-app = FastAPI(title="NBA Career Analytics")
 
+# Dataset-wide payloads never change between requests, so they are validated
+# and serialized once at startup and served as raw JSON bytes.
+_PLAYERS_JSON: bytes = b"[]"
+_LABELS_JSON: bytes = b"{}"
 
-@app.get("/players", response_model=list[PlayerListItem])
-def players():
-    return store.players()
 
+def _build_static_payloads():
+    global _PLAYERS_JSON, _LABELS_JSON
+    _PLAYERS_JSON = PlayerListAdapter.dump_json(PlayerListAdapter.validate_python(store.players()))
+    _LABELS_JSON = LabelSummaryResponse.model_validate(store.label_summary()).model_dump_json().encode()
 
-@app.get("/player/{player_id}/trajectory", response_model=list[TrajectoryPoint])
-def trajectory(player_id: int):
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await asyncio.to_thread(_build_static_payloads)
+    await cache.connect()
+    yield
+    await cache.disconnect()
+
+
+# Keep FastAPI's default response class: with a response_model set it dumps
+# straight to JSON bytes in pydantic-core, a fast path that any custom
+# default_response_class (e.g. ORJSONResponse) switches off.
+app = FastAPI(title="NBA Career Analytics", lifespan=lifespan)
+# Float-heavy JSON (players list, trajectories, projections) compresses several-fold.
+app.add_middleware(GZipMiddleware, minimum_size=512, compresslevel=5)
+# Repeat loads of the same player revalidate with a header-only 304.
+app.add_middleware(ETagMiddleware, version=store.version)
+# Redis keys carry the same version, so a rebuild never serves old bodies.
+cache.version = store.version
+
+
+# Routes that return pre-serialized bytes declare their schema via `responses=`
+# (docs only); the rest keep response_model, which validates and dumps the
+# store's plain dicts in a single pydantic-core pass.
+@app.get("/players", responses={200: {"model": list[PlayerListItem]}})
+async def players():
+    return Response(content=_PLAYERS_JSON, media_type="application/json")
+
+
+@app.get("/player/{player_id}/trajectory", responses={200: {"model": list[TrajectoryPoint]}})
+async def trajectory(player_id: int):
     # Return empty list if no data rather than 404 so UI can show "no seasons" gracefully.
-    return store.trajectory(player_id)
+    body = await asyncio.to_thread(store.trajectory_bytes, player_id)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/player/{player_id}/comps", response_model=list[SimilarPlayer])
-def comps(player_id: int, k: int = 3):
-    return store.comps(player_id, k)
+@cached("comps")
+async def comps(player_id: int, k: int = 3):
+    return await asyncio.to_thread(store.comps, player_id, k)
 
 
 @app.get("/player/{player_id}/comps_counting", response_model=list[SimilarPlayer])
-def comps_counting(player_id: int, k: int = 3):
+@cached("comps_counting")
+async def comps_counting(player_id: int, k: int = 3):
     try:
-        return store.comps_counting(player_id, k)
+        return await asyncio.to_thread(store.comps_counting, player_id, k)
     except Exception as e:
         raise HTTPException(status_code=503, detail=str(e))
 
 
 @app.get("/player/{player_id}/counting_geometry", response_model=CountingGeometryResponse)
-def counting_geometry(player_id: int, k: int = 3):
+@cached("counting_geometry")
+async def counting_geometry(player_id: int, k: int = 3):
     try:
-        return store.counting_geometry(player_id, k)
+        return await asyncio.to_thread(store.counting_geometry, player_id, k)
     except Exception as e:
         raise HTTPException(status_code=503, detail=str(e))
 
 
-@app.get("/player/{player_id}/label", response_model=LabelResponse)
-def label(player_id: int):
-    return store.label(player_id)
+@app.get("/player/{player_id}/label", responses={200: {"model": LabelResponse}})
+async def label(player_id: int):
+    # Precomputed for every player at startup: a dict lookup, no thread hop needed.
+    return Response(content=store.label_bytes(player_id), media_type="application/json")
 
 
-@app.get("/labels/summary", response_model=LabelSummaryResponse)
-def labels_summary():
-    return store.label_summary()
+@app.get("/labels/summary", responses={200: {"model": LabelSummaryResponse}})
+async def labels_summary():
+    return Response(content=_LABELS_JSON, media_type="application/json")
 
 
-@app.get("/player/{player_id}/projection", response_model=list[ProjectionPoint])
-def projection(player_id: int):
-    return store.projection(player_id)
+@app.get("/player/{player_id}/projection", responses={200: {"model": list[ProjectionPoint]}})
+async def projection(player_id: int):
+    body = await asyncio.to_thread(store.projection_bytes, player_id)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/player/{player_id}/forecast", response_model=list[ForecastPoint] | None)
-def forecast(player_id: int):
-    return store.forecast(player_id)
-
-
-@app.get("/player/{player_id}/radar", response_model=RadarResponse)
-def radar(player_id: int, k: int = 3):
-    return store.radar(player_id, k)
+@cached("forecast")
+async def forecast(player_id: int):
+    return await asyncio.to_thread(store.forecast, player_id)
+
+
+@app.get("/player/{player_id}/radar", responses={200: {"model": RadarResponse}})
+async def radar(player_id: int, k: int = 3):
+    # k=1..5 are precomputed; other k values are built on demand.
+    body = await asyncio.to_thread(store.radar_bytes, player_id, k)
+    return Response(content=body, media_type="application/json")
+
+
+@app.get("/player/{player_id}/bundle", responses={200: {"model": PlayerBundle}})
+@cached("bundle")
+async def bundle(player_id: int):
+    # trajectory + comps (k=3) + label + projection in one round trip for the player page.
+    # The sections are independent, so cold ones are built concurrently on the
+    # threadpool; the label is a precomputed lookup. Each section is already
+    # JSON, so the body is spliced together rather than re-serialized.
+    traj, comps_, proj = await asyncio.gather(
+        asyncio.to_thread(store.trajectory_bytes, player_id),
+        asyncio.to_thread(store.comps_bytes, player_id, 3),
+        asyncio.to_thread(store.projection_bytes, player_id),
+    )
+    body = b"".join(
+        (
+            b'{"trajectory":',
+            traj,
+            b',"comps":',
+            comps_,
+            b',"label":',
+            store.label_bytes(player_id),
+            b',"projection":',
+            proj,
+            b"}",
+        )
+    )
+    return Response(content=body, media_type="application/json")
+
+
+_INDEX_HTML = Path(__file__).resolve().parent / "static" / "index.html"
 
 
 @app.get("/", response_class=HTMLResponse)
-def index():
-    # Simple HTML that consumes the API and renders a dropdown + results.
-    return """
-    <!doctype html>
-    <html lang="en">
-    <head>
-      <meta charset="UTF-8" />
-      <meta name="viewport" content="width=device-width, initial-scale=1.0" />
-      <title>NBA Career Analytics</title>
-      <style>
-        body { font-family: sans-serif; max-width: 960px; margin: 2rem auto; padding: 0 1rem; }
-        h1 { margin-bottom: 0.5rem; }
-        select, button { padding: 0.35rem 0.5rem; font-size: 1rem; }
-        pre { background: #111; color: #f5f5f5; padding: 1rem; border-radius: 8px; overflow-x: auto; }
-        .row { display: flex; gap: 0.75rem; align-items: center; flex-wrap: wrap; }
-        .card { border: 1px solid #ddd; border-radius: 8px; padding: 0.75rem; margin-top: 1rem; }
-      </style>
-    </head>
-    <body>
-      <h1>NBA Career Analytics</h1>
-      <div class="row">
-        <label for="player">Player:</label>
-        <select id="player"></select>
-        <button id="load">Load</button>
-      </div>
-      <div class="card">
-        <h3>Label</h3>
-        <div id="label">—</div>
-      </div>
-      <div class="card">
-        <h3>Trajectory (raw)</h3>
-        <pre id="traj">[]</pre>
-      </div>
-      <div class="card">
-        <h3>Similar Players</h3>
-        <pre id="comps">[]</pre>
-      </div>
-      <div class="card">
-        <h3>Projection</h3>
-        <pre id="proj">[]</pre>
-      </div>
-      <script>
-        const playerSelect = document.getElementById("player");
-        const loadBtn = document.getElementById("load");
-        const labelDiv = document.getElementById("label");
-        const trajPre = document.getElementById("traj");
-        const compsPre = document.getElementById("comps");
-        const projPre = document.getElementById("proj");
-
-        async function fetchPlayers() {
-          const res = await fetch("/players");
-          const data = await res.json();
-          playerSelect.innerHTML = data
-            .map(p => `<option value="${p.player_id}">${p.name} (${p.from_year}-${p.to_year})</option>`)
-            .join("");
-        }
-
-        async function loadPlayer() {
-          const id = playerSelect.value;
-          if (!id) return;
-          const [traj, comps, label, proj] = await Promise.all([
-            fetch(`/player/${id}/trajectory`).then(r => r.json()),
-            fetch(`/player/${id}/comps`).then(r => r.json()),
-            fetch(`/player/${id}/label`).then(r => r.json()),
-            fetch(`/player/${id}/projection`).then(r => r.json()),
-          ]);
-          labelDiv.textContent = label.label || "—";
-          trajPre.textContent = JSON.stringify(traj, null, 2);
-          compsPre.textContent = JSON.stringify(comps, null, 2);
-          projPre.textContent = JSON.stringify(proj, null, 2);
-        }
-
-        loadBtn.addEventListener("click", loadPlayer);
-        fetchPlayers().then(() => loadPlayer());
-      </script>
-    </body>
-    </html>
-    """
+async def index():
+    # Static demo page (a dropdown + raw API output) that consumes the API above.
+    # A plain route rather than a catch-all mount, so unmatched methods on API
+    # paths still get 405; FileResponse streams it with ETag/Last-Modified.
+    return FileResponse(_INDEX_HTML, media_type="text/html")
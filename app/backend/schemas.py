@@ -1,7 +1,15 @@
-from pydantic import BaseModel
+from typing import TypedDict
 
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-class PlayerListItem(BaseModel):
+
+class APIModel(BaseModel):
+    # Response payloads are built once and never mutated; extra store columns
+    # are dropped rather than rejected.
+    model_config = ConfigDict(extra="ignore", frozen=True)
+
+
+class PlayerListItem(APIModel):
     player_id: int
     name: str
     position: str | None = None
@@ -13,7 +21,7 @@ class PlayerListItem(BaseModel):
     weight: float | None = None
 
 
-class TrajectoryPoint(BaseModel):
+class TrajectoryPoint(APIModel):
     season: int
     age: float | None
     gp: float | None
@@ -32,14 +40,14 @@ class TrajectoryPoint(BaseModel):
     annotation: str | None = None
 
 
-class SimilarPlayer(BaseModel):
+class SimilarPlayer(APIModel):
     player_id: int
     name: str
     distance: float
     similarity_rank: int
 
 
-class EmbeddingPoint(BaseModel):
+class EmbeddingPoint(APIModel):
     player_id: int
     name: str
     x: float
@@ -47,12 +55,12 @@ class EmbeddingPoint(BaseModel):
     distance: float | None = None
 
 
-class EmbeddingResponse(BaseModel):
+class EmbeddingResponse(APIModel):
     player: EmbeddingPoint | None
     comps: list[EmbeddingPoint]
 
 
-class RadarSeries(BaseModel):
+class RadarSeries(APIModel):
     player_id: int
     name: str
     pts_per_game: float | None = None
@@ -64,11 +72,11 @@ class RadarSeries(BaseModel):
     value_score: float | None = None
 
 
-class RadarResponse(BaseModel):
+class RadarResponse(APIModel):
     series: list[RadarSeries]
 
 
-class CountingGeometrySeries(BaseModel):
+class CountingGeometrySeries(APIModel):
     player_id: int
     name: str
     efficiency: float
@@ -82,35 +90,89 @@ class CountingGeometrySeries(BaseModel):
     distance: float | None = None
 
 
-class CountingGeometryResponse(BaseModel):
+class CountingGeometryResponse(APIModel):
     series: list[CountingGeometrySeries]
 
 
-class LabelResponse(BaseModel):
+class LabelResponse(APIModel):
     label: str
     rationale: str | None = None
     method: str
     injury_label: str | None = None
 
 
-class LabelCount(BaseModel):
+class LabelCount(APIModel):
     label: str
     count: int
 
 
-class LabelSummaryResponse(BaseModel):
+class LabelSummaryResponse(APIModel):
     total_players: int
     labels: list[LabelCount]
 
 
-class ForecastPoint(BaseModel):
+class ForecastPoint(APIModel):
     season: int
     median: float
     p10: float
     p90: float
 
 
-class ProjectionPoint(BaseModel):
+class ProjectionPoint(APIModel):
+    season: int
+    age: float | None
+    gp_pred: float | None
+    mpg_pred: float | None
+    pts_per_game_pred: float | None
+    ast_per_game_pred: float | None
+    reb_per_game_pred: float | None
+    fg3_per_game_pred: float | None
+    fg_pct_pred: float | None
+    ft_pct_pred: float | None
+    stl_per_game_pred: float | None
+    blk_per_game_pred: float | None
+    tov_per_game_pred: float | None
+    ts_pct_pred: float | None
+
+
+class PlayerBundle(APIModel):
+    trajectory: list[TrajectoryPoint]
+    comps: list[SimilarPlayer]
+    label: LabelResponse
+    projection: list[ProjectionPoint]
+
+
+# Whole-list validators for the hot list payloads: pydantic-core validates and
+# serializes the entire list in one call instead of one model at a time.
+PlayerListAdapter = TypeAdapter(list[PlayerListItem])
+SimilarPlayerListAdapter = TypeAdapter(list[SimilarPlayer])
+LabelResponseListAdapter = TypeAdapter(list[LabelResponse])
+
+
+# Plain-dict shapes of TrajectoryPoint / ProjectionPoint for the store's
+# hot paths: rows are built from trusted arrays already in the right types
+# and serialized with orjson, skipping per-field validation. The models above
+# remain the documented response schemas.
+class TrajectoryPointDict(TypedDict):
+    season: int
+    age: float | None
+    gp: float | None
+    mpg: float | None
+    pts_per_game: float | None
+    ast_per_game: float | None
+    reb_per_game: float | None
+    fg3_per_game: float | None
+    fg_pct: float | None
+    ft_pct: float | None
+    stl_per_game: float | None
+    blk_per_game: float | None
+    tov_per_game: float | None
+    ts_pct: float | None
+    value_score: float | None
+    annotation: str | None
+
+
+class ProjectionPointDict(TypedDict):
     season: int
     age: float | None
     gp_pred: float | None
@@ -1,34 +1,261 @@
-import joblib
+import functools
+import hashlib
+import math
+import os
+
 import numpy as np
+import orjson
 import pandas as pd
+import pyarrow.parquet as pq
 from pathlib import Path
-from sklearn.neighbors import NearestNeighbors
+from scipy.special import expit
 from sklearn.preprocessing import StandardScaler
 from collections import Counter
 
+try:
+    import faiss
+except ImportError:  # faiss is optional; comps fall back to a NumPy brute-force scan
+    faiss = None
+
+from .schemas import (
+    LabelResponse,
+    LabelResponseListAdapter,
+    ProjectionPointDict,
+    RadarResponse,
+    SimilarPlayerListAdapter,
+    TrajectoryPointDict,
+)
+from .store_kernels import (
+    CAREER_LABELS,
+    DEVELOPING_PROSPECT,
+    INJURY_LIMITED,
+    PROJECTION_FIELDS,
+    career_label_codes,
+    pairwise_euclidean,
+    project_kernel,
+)
+
+# Columns of player_seasons.parquet the Store reads (everything else derives from these).
+_PARQUET_COLUMNS = [
+    "player_id", "player_name", "position", "season", "player_age", "gp", "min",
+    "pts", "ast", "reb", "fg3m", "fgm", "fga", "ftm", "fta", "stl", "blk", "tov", "ts_pct", "pts_per75",
+]
+
+# Per-season stat columns kept in Store._season_arr (trajectory payload order).
+_SEASON_STAT_COLS = [
+    "mpg",
+    "pts_per_game",
+    "ast_per_game",
+    "reb_per_game",
+    "fg3_per_game",
+    "fg_pct",
+    "ft_pct",
+    "stl_per_game",
+    "blk_per_game",
+    "tov_per_game",
+    "ts_pct",
+    "value_score",
+]
+
+
+def _nearest(dist_row: np.ndarray, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Pick the n smallest entries of one row of a precomputed distance matrix.
+    Returns (distances, column indices), nearest first.
+    """
+    n = min(n, len(dist_row))
+    # Partial selection is O(N); only the n candidates get sorted (ties by column).
+    idx = np.argpartition(dist_row, n - 1)[:n]
+    idx = idx[np.lexsort((idx, dist_row[idx]))]
+    return dist_row[idx], idx
+
+
+# Neighbours kept per row in the startup kNN tables; covers comps windows up to
+# k=44 (k+20) and comps_counting up to k=14 (k+50). Larger k reads the full row.
+_KNN_TABLE_SIZE = 64
+
+
+def _knn_table(pairwise: np.ndarray, m: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    _nearest for every row of a distance matrix in one batched pass.
+    Returns (distances, column indices) of shape (rows, m), nearest first.
+    """
+    m = min(m, pairwise.shape[1])
+    idx = np.argpartition(pairwise, m - 1, axis=1)[:, :m]
+    dist = np.take_along_axis(pairwise, idx, axis=1)
+    order = np.lexsort((idx, dist), axis=1)
+    return np.take_along_axis(dist, order, axis=1), np.take_along_axis(idx, order, axis=1)
+
+
+def _neighbors(space: dict, row: int, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """n nearest columns for one row of a similarity space, from its kNN table when it is deep enough."""
+    if n <= space["knn_idx"].shape[1]:
+        return space["knn_dist"][row, :n], space["knn_idx"][row, :n]
+    return _nearest(space["pairwise"][row], n)
+
+
+def _comp_neighbors(space: dict, row: int, n: int, k: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Up to k of the n nearest columns for a row, dropping the player itself and
+    anyone outside the selectable list (space["eligible"]) in one mask.
+    """
+    dist, idx = _neighbors(space, row, n)
+    keep = space["eligible"][idx] & (idx != row)
+    return dist[keep][:k], idx[keep][:k]
+
+
+def _standardize(scaler: StandardScaler, X, dtype) -> np.ndarray:
+    """
+    scaler.transform(X) applied straight from the fitted mean_/scale_, in place
+    on one float64 buffer, then cast to `dtype`. Same arithmetic as sklearn
+    without its per-call input validation (or the feature-name warning for
+    scalers fitted on bare arrays).
+    """
+    Z = np.array(X, dtype=np.float64)
+    if scaler.with_mean:
+        Z -= scaler.mean_
+    if scaler.with_std:
+        Z /= scaler.scale_
+    return Z.astype(dtype, copy=False)
+
+
+def _age_delta(age: float) -> float:
+    # Forecast value_score adjustment for a season played at `age` (peak ~27).
+    if age < 23:
+        return 0.05
+    if 23 <= age < 27:
+        return 0.02
+    if 27 <= age < 30:
+        return -0.01
+    if 30 <= age < 33:
+        return -0.04
+    return -0.08
+
+
+def _clean_records(df: pd.DataFrame) -> list[dict]:
+    """
+    df.to_dict("records") with missing and infinite values as None, built
+    column-wise via .tolist() (plain Python scalars) instead of a full replace().
+    """
+
+    def clean(v):
+        if v is pd.NA or (isinstance(v, float) and not math.isfinite(v)):
+            return None
+        return v
+
+    columns = [[clean(v) for v in df[c].tolist()] for c in df.columns]
+    return [dict(zip(df.columns, row)) for row in zip(*columns)]
+
+
+def _season_tags(cols: dict[str, np.ndarray]) -> np.ndarray:
+    """
+    Trajectory annotation for every season row: the first two matching tags
+    (in rule order) joined by a space, or None when nothing stands out.
+    Missing stats count as 0.
+    """
+
+    def col(name: str) -> np.ndarray:
+        return np.nan_to_num(cols[name].astype(np.float64), nan=0.0)
+
+    gp, mpg, pts, ts = col("gp"), col("mpg"), col("pts_per_game"), col("ts_pct")
+    fg3, ast, reb, blk = col("fg3_per_game"), col("ast_per_game"), col("reb_per_game"), col("blk_per_game")
+    stl_blk = col("stl_per_game") + blk
+    val, age = col("value_score"), col("age")
+
+    # One column per rule; "" where the rule doesn't fire.
+    tags = np.stack(
+        [
+            np.where(gp < 40, "LowGP", ""),
+            np.where(mpg < 18, "LowMP", ""),
+            np.where(pts > 20, np.char.mod("%.1fPPG", pts).astype("U6"), ""),
+            np.where(ts > 0.62, "TS62+", np.where(ts < 0.52, "TS<52", "")),
+            np.where(fg3 > 2.5, np.char.mod("3PM%.1f", fg3).astype("U7"), ""),
+            np.where(ast > 7, "AST7+", ""),
+            np.where(reb > 10, "REB10+", ""),
+            np.where(stl_blk > 2.0, "DEF2+", ""),
+            np.where(blk > 1.5, "BLK1.5", ""),
+            np.where(val > 1.0, "VAL1.0", ""),
+            np.where((age > 30) & (val < 0.2), "DECLINE", ""),
+        ],
+        axis=1,
+    )
+    # Keep at most two short tags: the columns where the running count of
+    # fired rules first reaches 1 and 2.
+    fired = np.cumsum(tags != "", axis=1)
+    n_fired = fired[:, -1]
+    rows = np.arange(len(tags))
+    first = np.where(n_fired >= 1, tags[rows, np.argmax(fired == 1, axis=1)], "")
+    second = np.where(n_fired >= 2, tags[rows, np.argmax(fired == 2, axis=1)], "")
+    joined = np.char.add(np.char.add(first, np.where(n_fired >= 2, " ", "")), second)
+    return np.where(n_fired > 0, joined.astype(object), None)
+
+
+def _str_array(values) -> np.ndarray:
+    """Object array of str(value) per entry, with missing values as "None"."""
+    arr = np.asarray(values, dtype=object)
+    return np.where(pd.isna(arr), "None", arr.astype(str)).astype(object)
+
+
+# Last-season fields the projection is derived from (see _project).
+_PROJECTION_INPUTS = (
+    "player_age", "gp", "min", "pts", "ast", "reb", "fg3m", "fgm", "fga", "ftm", "fta", "stl", "blk", "tov", "ts_pct",
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _project(season: int, base: tuple) -> list[ProjectionPointDict]:
+    """
+    5-year projection from a player's last season: `base` holds the
+    _PROJECTION_INPUTS values in order (None if missing). A pure function of
+    its arguments, so it is memoized; callers must treat results as read-only.
+    """
+    rows = project_kernel(*(np.nan if v is None else v for v in base)).tolist()
+    return [
+        {"season": season + i, **{k: (v if v == v else None) for k, v in zip(PROJECTION_FIELDS, row)}}
+        for i, row in enumerate(rows, start=1)
+    ]
+
 
 class Store:
     def __init__(self):
         # Build absolute paths so uvicorn can be launched from any cwd.
         root = Path(__file__).resolve().parents[2]
         self.parquet = root / "data/clean/player_seasons.parquet"
-        self.sim_path = root / "models/similarity.pkl"
+        # Similarity artifacts from scripts/build_similarity.py.
+        self.sim_dir = root / "models/similarity"
         # Bio/position enrichment (CSV generated externally).
         self.positions_path = root / "data/clean/player_bio.csv"
-
-        # Load full dataset into memory via pandas to avoid duckdb instabilities / segfaults.
-        self.df = pd.read_parquet(self.parquet)
+        # Startup-built arrays are saved here and memory-mapped (see _cached_array).
+        self.cache_dir = root / "models/cache"
+
+        # Fingerprint of the inputs and the backend code that derives everything
+        # from them; any change yields fresh cached arrays.
+        digest = hashlib.sha1()
+        sim_files = [self.sim_dir / "feature_df.parquet", self.sim_dir / "Xn.npy"]
+        for path in [self.parquet, *sim_files, self.positions_path, *sorted(Path(__file__).parent.glob("*.py"))]:
+            if path.exists():
+                digest.update(path.read_bytes())
+        self.version = digest.hexdigest()[:12]
+
+        # Load the dataset into memory via pandas (no duckdb: instabilities / segfaults),
+        # reading only the columns the Store uses from a memory-mapped file.
+        self.df = pq.read_table(self.parquet, columns=_PARQUET_COLUMNS, memory_map=True).to_pandas()
         # Derive per-game and composite fields
-        self.df["pts_per_game"] = self.df["pts"] / self.df["gp"].replace({0: pd.NA})
-        self.df["ast_per_game"] = self.df["ast"] / self.df["gp"].replace({0: pd.NA})
-        self.df["reb_per_game"] = self.df["reb"] / self.df["gp"].replace({0: pd.NA})
-        self.df["fg3_per_game"] = self.df["fg3m"] / self.df["gp"].replace({0: pd.NA})
-        self.df["fg_pct"] = self.df["fgm"] / self.df["fga"].replace({0: pd.NA})
-        self.df["ft_pct"] = self.df["ftm"] / self.df["fta"].replace({0: pd.NA})
-        self.df["stl_per_game"] = self.df["stl"] / self.df["gp"].replace({0: pd.NA})
-        self.df["blk_per_game"] = self.df["blk"] / self.df["gp"].replace({0: pd.NA})
-        self.df["tov_per_game"] = self.df["tov"] / self.df["gp"].replace({0: pd.NA})
-        self.df["mpg"] = self.df["min"] / self.df["gp"].replace({0: pd.NA})
+        def ratio(num: str, den: str) -> np.ndarray:
+            # Plain float64 division; a zero denominator (no games/attempts) gives NaN.
+            d = self.df[den].to_numpy(dtype=np.float64)
+            return self.df[num].to_numpy(dtype=np.float64) / np.where(d != 0, d, np.nan)
+
+        self.df["pts_per_game"] = ratio("pts", "gp")
+        self.df["ast_per_game"] = ratio("ast", "gp")
+        self.df["reb_per_game"] = ratio("reb", "gp")
+        self.df["fg3_per_game"] = ratio("fg3m", "gp")
+        self.df["fg_pct"] = ratio("fgm", "fga")
+        self.df["ft_pct"] = ratio("ftm", "fta")
+        self.df["stl_per_game"] = ratio("stl", "gp")
+        self.df["blk_per_game"] = ratio("blk", "gp")
+        self.df["tov_per_game"] = ratio("tov", "gp")
+        self.df["mpg"] = ratio("min", "gp")
 
         # Season-level z-scores for impact/load
         feat_for_z = [
@@ -40,24 +267,27 @@ class Store:
             "ts_pct",
             "tov_per_game",
         ]
-        season_stats = (
-            self.df.groupby("season")[feat_for_z]
-            .agg(["mean", "std"])
-            .rename_axis(index="season")
-        )
-
-        def z_score(row, col):
-            mean = season_stats.loc[row["season"], (col, "mean")]
-            std = season_stats.loc[row["season"], (col, "std")]
-            if pd.isna(std) or std == 0:
-                return 0.0
-            val = row[col]
-            if pd.isna(val):
-                return 0.0
-            return (val - mean) / std
-
-        for col in feat_for_z:
-            self.df[f"z_{col}"] = self.df.apply(lambda r, c=col: z_score(r, c), axis=1)
+        # Per-season count/mean/sample std for all features at once via scatter-adds
+        # over the season codes, broadcast back onto the rows. Missing values and
+        # seasons with no spread (std 0 or NaN) score 0.
+        codes, uniq = pd.factorize(self.df["season"])
+        vals = self.df[feat_for_z].to_numpy(dtype=np.float64)
+        present = ~np.isnan(vals)
+        filled = np.where(present, vals, 0.0)
+        count = np.zeros((len(uniq), len(feat_for_z)))
+        total = np.zeros_like(count)
+        np.add.at(count, codes, present)
+        np.add.at(total, codes, filled)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / count
+            centered = np.where(present, vals - mean[codes], 0.0)
+            sumsq = np.zeros_like(count)
+            np.add.at(sumsq, codes, centered * centered)
+            std = np.sqrt(sumsq / (count - 1))[codes]
+            z = centered / std
+        z[~((std != 0) & ~np.isnan(std) & present)] = 0.0
+        for i, col in enumerate(feat_for_z):
+            self.df[f"z_{col}"] = z[:, i]
 
         # Impact proxy
         self.df["impact_score"] = (
@@ -83,84 +313,133 @@ class Store:
             + 0.15 * self.df["off_load"]
         )
 
+        # Columnar copy of the per-season table for per-player reads (see _build_season_arrays).
+        self._season_arr, self._idx = self._build_season_arrays()
+        # Per-player row groups (original row order), so request paths do a dict
+        # lookup instead of a boolean scan over the whole table.
+        self._by_pid: dict[int, pd.DataFrame] = {
+            int(pid): g for pid, g in self.df.groupby("player_id", sort=False)
+        }
+        self._by_pid_pre2025: dict[int, pd.DataFrame] = {
+            pid: g[g.season < 2025] for pid, g in self._by_pid.items()
+        }
+        # Row position of each player's latest season with games (season < 2025,
+        # gp > 0), plus the radar stat columns as arrays to index with it.
+        valid = (self.df["season"] < 2025) & (self.df["gp"] > 0)
+        latest_rows = (
+            pd.DataFrame({"player_id": self.df["player_id"], "season": self.df["season"], "row": np.arange(len(self.df))})[valid]
+            .sort_values(["player_id", "season"])
+            .drop_duplicates("player_id", keep="last")
+        )
+        self._last_row_by_pid: dict[int, int] = dict(
+            zip(latest_rows["player_id"].astype(int).tolist(), latest_rows["row"].tolist())
+        )
+        # Season and projection inputs per df row, read at the same row positions.
+        self._seasons = self.df["season"].to_numpy()
+        self._projection_inputs = self.df[list(_PROJECTION_INPUTS)].to_numpy(dtype=np.float64)
+        self._radar_cols: dict[str, np.ndarray] = {
+            c: self.df[c].to_numpy(dtype=np.float64)
+            for c in ["pts_per_game", "ast_per_game", "reb_per_game", "fg3_per_game", "ts_pct", "availability", "value_score"]
+        }
+        # Players with a 2025 row (the ones forecast covers).
+        self._pids_2025: set[int] = set(self.df.loc[self.df.season == 2025, "player_id"].astype(int).tolist())
+
         # Count seasons with games played to filter short careers in the UI list.
-        season_counts = (
-            self.df[self.df["gp"] > 0]
-            .groupby("player_id")["season"]
-            .nunique()
-            .rename("season_count")
+        # Distinct (player, season) pairs sorted by player then season, split
+        # into one sorted season list per player.
+        played = (
+            self.df.loc[self.df["gp"] > 0, ["player_id", "season"]]
+            .drop_duplicates()
+            .sort_values(["player_id", "season"])
         )
-        seasons_played = (
-            self.df[self.df["gp"] > 0]
-            .groupby("player_id")["season"]
-            .apply(lambda s: sorted(set(int(x) for x in s.tolist())))
-            .rename("seasons_played")
+        played_ids, starts, counts = np.unique(played["player_id"].to_numpy(), return_index=True, return_counts=True)
+        seasons = played["season"].tolist()
+        season_counts = pd.Series(counts, index=played_ids)
+        seasons_played = pd.Series(
+            [seasons[i : i + n] for i, n in zip(starts.tolist(), counts.tolist())], index=played_ids, dtype=object
         )
 
-        self.players_df = (
+        base = (
             self.df.groupby(["player_id", "player_name", "position"], dropna=False)
             .agg(from_year=("season", "min"), to_year=("season", "max"))
             .reset_index()
         )
-        self.players_df = self.players_df.merge(season_counts, on="player_id", how="left")
-        self.players_df["season_count"] = self.players_df["season_count"].fillna(0).astype(int)
-        self.players_df = self.players_df.merge(seasons_played, on="player_id", how="left")
-        # Merge enriched positions (and height/weight) if available
+        pids = base["player_id"]
+        # Enriched positions (and height/weight) if available, one row per player_id.
+        bio = pd.DataFrame()
         if self.positions_path.exists():
             if self.positions_path.suffix.lower() == ".parquet":
                 pos_df = pd.read_parquet(self.positions_path)
             else:
                 pos_df = pd.read_csv(self.positions_path)
-            # Drop name to avoid duplicate column names after merge
-            if "name" in pos_df.columns:
-                pos_df = pos_df.drop(columns=["name"])
-            # Align expected column names
+            # Name comes from the seasons table; align expected column names.
+            pos_df = pos_df.drop(columns=["name"], errors="ignore")
             if "position" in pos_df.columns and "primary_position" not in pos_df.columns:
                 pos_df = pos_df.rename(columns={"position": "primary_position"})
-            self.players_df = self.players_df.merge(pos_df, on="player_id", how="left")
+            bio = pos_df.drop_duplicates("player_id").set_index("player_id")
+
+        # Assemble every column against base's rows, then build the frame once.
+        if "primary_position" in bio:
+            primary = pids.map(bio["primary_position"])
         else:
-            self.players_df["primary_position"] = None
-
-        # Align schema expectations
-        self.players_df = self.players_df.rename(columns={"player_name": "name"})
-        # Prefer enriched position
-        self.players_df["position"] = self.players_df["primary_position"].fillna(self.players_df["position"])
-        # Cast position and name to string to satisfy response model
-        self.players_df["position"] = self.players_df["position"].astype(str)
-        self.players_df["name"] = self.players_df["name"].astype(str)
-        # Drop duplicate columns if any remain
-        self.players_df = self.players_df.loc[:, ~self.players_df.columns.duplicated()]
+            primary = pd.Series(None, index=pids.index, dtype=object)
+        cols = {
+            "player_id": pids.to_numpy(dtype=np.int64),
+            # Name and position as strings to satisfy the response model; prefer enriched position.
+            "name": _str_array(base["player_name"]),
+            "position": _str_array(primary.fillna(base["position"])),
+            "from_year": base["from_year"].to_numpy(dtype=np.int64),
+            "to_year": base["to_year"].to_numpy(dtype=np.int64),
+            "season_count": season_counts.reindex(pids, fill_value=0).to_numpy(dtype=np.int32),
+            "seasons_played": pids.map(seasons_played).to_numpy(dtype=object),
+        }
+        for c in bio.columns:
+            cols.setdefault(c, pids.map(bio[c]))
+        cols.setdefault("primary_position", primary)
         # Clean height/weight types
-        if "height" in self.players_df.columns:
-            self.players_df["height"] = self.players_df["height"].astype(str)
-            self.players_df.loc[self.players_df["height"].isin(["nan", "None"]), "height"] = None
-        if "weight" in self.players_df.columns:
-            self.players_df["weight"] = pd.to_numeric(self.players_df["weight"], errors="coerce")
+        if "height" in cols:
+            height = cols["height"].to_numpy(dtype=object)
+            cols["height"] = np.where(pd.isna(height), None, height)
+        if "weight" in cols:
+            cols["weight"] = pd.to_numeric(cols["weight"], errors="coerce")
+        self.players_df = pd.DataFrame(cols)
+        # First listed name per player_id (players_df can repeat an id across name/position variants).
+        self._name_by_pid: dict[int, str] = (
+            self.players_df.drop_duplicates("player_id").set_index("player_id")["name"].to_dict()
+        )
         self.season_count_by_id = dict(
-            zip(self.players_df["player_id"].astype(int).tolist(), self.players_df["season_count"].astype(int).tolist())
+            zip(self.players_df["player_id"].tolist(), self.players_df["season_count"].tolist())
         )
-        self.sim = joblib.load(str(self.sim_path)) if self.sim_path.exists() else None
+        # players_df is fixed after this point; build the /players records once.
+        self._players_records = _clean_records(self.players_df)
+        self.sim = self._load_sim()
+        self._sim_brute_state = None
         self.sim_latest = None
         if self.sim:
             try:
-                scaler = self.sim["scaler"]
-                feat_df = self.sim["feature_df"]
-                features = self.sim.get("features", [c for c in feat_df.columns if c not in ["player_id", "season"]])
-                latest_feat = (
-                    feat_df.sort_values("season")
-                    .groupby("player_id", as_index=False)
+                # Each player's latest season row in the similarity table.
+                latest = (
+                    pd.DataFrame({"player_id": self.sim["player_ids"], "season": self.sim["seasons"]})
+                    .sort_values("season")
+                    .groupby("player_id")
                     .tail(1)
-                    .copy()
+                    .index.to_numpy()
                 )
-                Xn = scaler.transform(latest_feat[features])
-                nn = NearestNeighbors(metric="euclidean")
-                nn.fit(Xn)
+                # Xn.npy is float32, which halves the bytes the distance kernel
+                # streams; the pairwise output is float32 already.
+                Xn = self.sim["X"][latest]
+                player_ids = self.sim["player_ids"][latest].tolist()
+                # All-pairs distances between players' latest feature rows.
+                pairwise = self._cached_array("sim_latest_pairwise", lambda: pairwise_euclidean(Xn, Xn))
+                knn_dist, knn_idx = _knn_table(pairwise, _KNN_TABLE_SIZE)
                 self.sim_latest = {
-                    "nn": nn,
-                    "scaler": scaler,
-                    "features": features,
-                    "player_ids": latest_feat["player_id"].astype(int).to_list(),
-                    "latest_feat": latest_feat[["player_id"] + features].copy(),
+                    "pairwise": pairwise,
+                    "knn_dist": knn_dist,
+                    "knn_idx": knn_idx,
+                    "player_ids": player_ids,
+                    "row_by_pid": {pid: i for i, pid in enumerate(player_ids)},
+                    # Comps stay aligned with the selectable player list (>= 3 seasons with games played).
+                    "eligible": np.array([self.season_count_by_id.get(pid, 0) >= 3 for pid in player_ids], dtype=bool),
                 }
             except Exception as e:
                 print(f"[sim_latest] build failed: {e}")
@@ -175,6 +454,101 @@ class Store:
         self._ensure_counting_sim()
         self._label_summary_cache = None
         self._forecast_cache = {}
+        # Serialized JSON per known player_id, filled on first request (unknown
+        # ids are answered without being stored, so the dicts stay bounded).
+        self._traj_json: dict[int, bytes] = {}
+        self._proj_json: dict[int, bytes] = {}
+
+        # Labels and small-k radars depend only on the static dataset, so they
+        # are computed for every player up front and served as JSON bytes.
+        self._label_df = self._label_table(self.df[self.df.season < 2025])
+        label_pids = self._label_df.index.tolist()
+        label_rows = LabelResponseListAdapter.validate_python([self.label(pid) for pid in label_pids])
+        self._labels: dict[int, bytes] = {
+            pid: row.model_dump_json().encode() for pid, row in zip(label_pids, label_rows)
+        }
+        self._radar_json: dict[int, dict[int, bytes]] = {
+            pid: {
+                k: RadarResponse.model_validate(self.radar(pid, k)).model_dump_json().encode()
+                for k in range(1, 6)
+            }
+            for pid in self.players_df["player_id"].unique().tolist()
+        }
+
+        # Bounded in-process memo for per-player lookups that have no byte cache
+        # (works with or without Redis). Hits return the same objects, so callers
+        # must treat results as read-only. Installed after the precompute above
+        # so startup doesn't flood the LRU.
+        self.comps = functools.lru_cache(maxsize=4096)(self.comps)
+        self.comps_counting = functools.lru_cache(maxsize=4096)(self.comps_counting)
+        self.counting_geometry = functools.lru_cache(maxsize=4096)(self.counting_geometry)
+        self.radar = functools.lru_cache(maxsize=4096)(self.radar)
+
+    def _build_season_arrays(self) -> tuple[np.recarray, dict[int, slice]]:
+        """
+        Struct-of-arrays view of self.df: one typed column per field, rows sorted
+        by (player_id, season) so each player's seasons form a contiguous slice,
+        located through the returned player_id -> slice index. gp and the stat
+        columns stay float64 (NaN for missing) so rows dump without per-record
+        conversion; the trajectory annotation is precomputed per row.
+        """
+        d = self.df.sort_values(["player_id", "season"])
+        dtype = [("player_id", "<i4"), ("season", "<i2"), ("age", "<f8"), ("gp", "<f8")]
+        dtype += [(c, "<f8") for c in _SEASON_STAT_COLS]
+        columns = [d["player_id"], d["season"], d["player_age"], d["gp"]]
+        columns += [pd.to_numeric(d[c], errors="coerce") for c in _SEASON_STAT_COLS]
+        cols = {name: np.asarray(c, dtype=t) for c, (name, t) in zip(columns, dtype)}
+        cols["annotation"] = _season_tags(cols)
+        dtype.append(("annotation", "O"))
+        arr = np.rec.fromarrays(list(cols.values()), dtype=dtype)
+
+        pids, starts, counts = np.unique(arr.player_id, return_index=True, return_counts=True)
+        idx = {
+            pid: slice(start, start + count)
+            for pid, start, count in zip(pids.tolist(), starts.tolist(), counts.tolist())
+        }
+        return arr, idx
+
+    def _cached_array(self, name: str, build) -> np.ndarray:
+        """
+        Return a read-only memory-mapped copy of an array derived at startup,
+        building and saving it on first use. Every worker process maps the same
+        file, so the OS page cache holds one physical copy for all of them.
+        """
+        path = self.cache_dir / f"{name}-{self.version}.npy"
+        if not path.exists():
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write under a per-process name, then rename, so concurrently
+            # starting workers never map a half-written file.
+            tmp = self.cache_dir / f"{name}-{self.version}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    np.save(f, build())
+                os.replace(tmp, path)
+            finally:
+                # Leave no partial file behind if build() or the write failed.
+                tmp.unlink(missing_ok=True)
+            # Drop arrays left over from older data/code versions.
+            for stale in self.cache_dir.glob(f"{name}-*.npy"):
+                if stale != path:
+                    stale.unlink(missing_ok=True)
+        return np.load(path, mmap_mode="r")
+
+    def _load_sim(self) -> dict | None:
+        """
+        The per-season similarity rows written by scripts/build_similarity.py:
+        player ids and seasons from feature_df.parquet, and the standardized
+        features memory-mapped from Xn.npy.
+        """
+        xn_path = self.sim_dir / "Xn.npy"
+        if not xn_path.exists():
+            return None
+        keys = pd.read_parquet(self.sim_dir / "feature_df.parquet", columns=["player_id", "season"])
+        return {
+            "player_ids": keys["player_id"].to_numpy(dtype=np.int64),
+            "seasons": keys["season"].to_numpy(dtype=np.int64),
+            "X": np.load(xn_path, mmap_mode="r"),
+        }
 
     def _ensure_counting_sim(self):
         if self.counting_sim is not None:
@@ -187,10 +561,15 @@ class Store:
             if pool_sized.empty:
                 pool_sized = pool
 
-            pool_sized["_mpg_for_peak"] = pool_sized["mpg"].fillna(0.0)
-            idx = pool_sized.groupby("player_id")["_mpg_for_peak"].idxmax()
-            peak = pool_sized.loc[idx].drop(columns=["_mpg_for_peak"]).copy()
-            peak = peak.sort_values(["player_id", "season"])
+            # Highest-MPG row per player; the stable sort keeps the earliest row
+            # on ties (same pick as groupby idxmax, without the group gather).
+            peak = (
+                pool_sized.assign(_mpg_for_peak=pool_sized["mpg"].fillna(0.0))
+                .sort_values("_mpg_for_peak", ascending=False, kind="stable")
+                .drop_duplicates("player_id", keep="first")
+                .drop(columns=["_mpg_for_peak"])
+                .sort_values(["player_id", "season"])
+            )
             features = [
                 "ts_pct",  # efficiency
                 "fg3_per_game",  # threes
@@ -204,18 +583,28 @@ class Store:
             X = peak[features].fillna(0.0)
             scaler = StandardScaler()
             Xn = scaler.fit_transform(X)
-            nn = NearestNeighbors(metric="euclidean")
-            nn.fit(Xn)
-            norm = 1.0 / (1.0 + np.exp(-Xn))
+            norm = expit(Xn)
             pids = peak["player_id"].astype(int).to_list()
-            geometry_by_id = {pid: norm[i] for i, pid in enumerate(pids)}
+            # comps_counting queries with each player's latest season, so
+            # precompute latest-season -> peak-season distances for everyone.
+            latest_rows = [self._last_row_by_pid[pid] for pid in pids]
+            latest = np.nan_to_num(self.df[features].to_numpy(dtype=np.float64)[latest_rows], nan=0.0)
+            Q = _standardize(scaler, latest, np.float32)
+            X32 = Xn.astype(np.float32)
+            pairwise = self._cached_array("counting_pairwise", lambda: pairwise_euclidean(Q, X32))
+            knn_dist, knn_idx = _knn_table(pairwise, _KNN_TABLE_SIZE)
             self.counting_sim = {
-                "nn": nn,
+                "pairwise": pairwise,
+                "knn_dist": knn_dist,
+                "knn_idx": knn_idx,
                 "scaler": scaler,
                 "features": features,
                 "player_ids": pids,
+                "row_by_pid": {pid: i for i, pid in enumerate(pids)},
+                "eligible": np.array([self.season_count_by_id.get(pid, 0) >= 3 for pid in pids], dtype=bool),
                 "peak": peak[["player_id", "season"] + features].copy(),
-                "geometry_by_id": geometry_by_id,
+                # Row i is the geometry of player_ids[i] (see row_by_pid).
+                "geom_matrix": norm,
             }
         except Exception as e:
             # Keep the rest of the app running even if this optional model fails.
@@ -225,133 +614,72 @@ class Store:
 
     def players(self):
         # Return full set; frontend can choose to filter (e.g., season_count >= 3).
-        clean = self.players_df.replace({pd.NA: None, np.nan: None, np.inf: None, -np.inf: None})
-        return clean.to_dict("records")
+        return self._players_records
 
-    def trajectory(self, player_id: int):
-        g = self.df[(self.df.player_id == player_id) & (self.df.season < 2025)].copy()
-        if g.empty:
+    def trajectory(self, player_id: int) -> list[TrajectoryPointDict]:
+        sl = self._idx.get(player_id)
+        if sl is None:
             return []
-        g = g.sort_values("season")
-        cols = [
-            "season",
-            "player_age",
-            "gp",
-            "mpg",
-            "pts_per_game",
-            "ast_per_game",
-            "reb_per_game",
-            "fg3_per_game",
-            "fg_pct",
-            "ft_pct",
-            "stl_per_game",
-            "blk_per_game",
-            "tov_per_game",
-            "ts_pct",
-            "value_score",
-            "annotation",
+        rows = self._season_arr[sl]
+        rows = rows[rows.season < 2025]
+        fields = rows.dtype.names[1:]
+        records = [
+            {f: (None if v != v else v) for f, v in zip(fields, rec[1:])}
+            for rec in rows.tolist()
         ]
-        g = g[cols]
-        g = g.rename(columns={"player_age": "age"})
-        g = g.where(pd.notna(g), None)
-
-        def tag_row(row):
-            tags = []
-            ts = row["ts_pct"] or 0
-            pts = row["pts_per_game"] or 0
-            ast = row["ast_per_game"] or 0
-            reb = row["reb_per_game"] or 0
-            fg3 = row["fg3_per_game"] or 0
-            stl_blk = (row["stl_per_game"] or 0) + (row["blk_per_game"] or 0)
-            blk = row["blk_per_game"] or 0
-            gp = row["gp"] or 0
-            mpg = row["mpg"] or 0
-            val = row.get("value_score") or 0
-            age = row.get("age") or 0
-
-            if gp < 40:
-                tags.append("LowGP")
-            if mpg < 18:
-                tags.append("LowMP")
-            if pts > 26:
-                tags.append(f"{pts:.1f}PPG"[:6])
-            elif pts > 20:
-                tags.append(f"{pts:.1f}PPG"[:6])
-            if ts > 0.62:
-                tags.append("TS62+")
-            elif ts < 0.52:
-                tags.append("TS<52")
-            if fg3 > 2.5:
-                tags.append(f"3PM{fg3:.1f}"[:7])
-            if ast > 7:
-                tags.append("AST7+")
-            if reb > 10:
-                tags.append("REB10+")
-            if stl_blk > 2.0:
-                tags.append("DEF2+")
-            if blk > 1.5:
-                tags.append("BLK1.5")
-            if val > 1.0:
-                tags.append("VAL1.0")
-            if age > 30 and val < 0.2:
-                tags.append("DECLINE")
-
-            # Keep at most two short tags
-            return " ".join(tags[:2]) if tags else None
-
-        g["annotation"] = g.apply(tag_row, axis=1)
-        return g.to_dict("records")
+        return records
+
+    def trajectory_bytes(self, player_id: int) -> bytes:
+        body = self._traj_json.get(player_id)
+        if body is None:
+            body = orjson.dumps(self.trajectory(player_id))
+            if player_id in self._idx:
+                self._traj_json[player_id] = body
+        return body
 
     def comps(self, player_id: int, k: int):
+        # Like the original first-match loop, always return at least one comp.
+        k = max(k, 1)
         # Prefer a player-level similarity space (one vector per player) for stability.
         if self.sim_latest:
-            nn = self.sim_latest["nn"]
-            scaler = self.sim_latest["scaler"]
-            features = self.sim_latest["features"]
-            latest_feat = self.sim_latest["latest_feat"]
-
-            row = latest_feat[latest_feat.player_id == player_id]
-            if row.empty:
+            player_ids = self.sim_latest["player_ids"]
+            row = self.sim_latest["row_by_pid"].get(player_id)
+            if row is None:
                 return []
-            Xn = scaler.transform(row[features])
-            dist, idx = nn.kneighbors(Xn, n_neighbors=min(k + 20, len(latest_feat)))
-
-            out = []
-            for d, i in zip(dist[0], idx[0]):
-                pid = int(latest_feat.iloc[i].player_id)
-                if pid == player_id:
-                    continue
-                if self.season_count_by_id.get(pid, 0) < 3:
-                    continue
-                name = self.players_df.loc[self.players_df.player_id == pid, "name"]
-                out.append(
-                    {
-                        "player_id": pid,
-                        "name": name.iloc[0] if not name.empty else "Unknown",
-                        "distance": float(d),
-                    }
-                )
-                if len(out) >= k:
-                    break
-            for idx_rank, item in enumerate(out, start=1):
-                item["similarity_rank"] = idx_rank
-            return out
+            dist, idx = _comp_neighbors(self.sim_latest, row, k + 20, k)
+            return [
+                {
+                    "player_id": player_ids[i],
+                    "name": self._name_by_pid.get(player_ids[i], "Unknown"),
+                    "distance": float(d),
+                    "similarity_rank": rank,
+                }
+                for rank, (d, i) in enumerate(zip(dist.tolist(), idx.tolist()), start=1)
+            ]
 
         if not self.sim:
             return []
-        scaler = self.sim["scaler"]
-        nn = self.sim["nn"]
-        feat_df = self.sim["feature_df"]
-        features = self.sim.get("features", [c for c in feat_df.columns if c not in ["player_id", "season"]])
-        row = feat_df[feat_df.player_id == player_id].tail(1)
-        if row.empty:
+        brute = self._sim_brute()
+        rows = np.flatnonzero(brute["player_ids"] == player_id)
+        if len(rows) == 0:
             return []
-        Xn = scaler.transform(row[features])
+        X, q = brute["X"], brute["X"][rows[-1]]
         # Grab extra neighbors then dedupe by player_id (feature_df has per-season rows)
-        dist, idx = nn.kneighbors(Xn, n_neighbors=min(k + 20, len(feat_df)))
+        if brute["index"] is not None:
+            # The index may be quantized: use it to pick candidates, then
+            # rank them by exact distance over the float rows.
+            _, idx = brute["index"].search(q[None].astype(np.float32), k + 20)
+            idx = idx[0][idx[0] >= 0]
+            dist = np.sqrt(np.einsum("ij,ij->i", X[idx] - q, X[idx] - q))
+            order = np.argsort(dist, kind="stable")
+            dist, idx = dist[order], idx[order]
+        else:
+            # |x - q|^2 = |x|^2 - 2 x.q + |q|^2 with the |x|^2 term precomputed: one GEMV per query.
+            d2 = brute["norms"] - 2.0 * (X @ q) + q @ q
+            dist, idx = _nearest(np.sqrt(np.maximum(d2, 0.0)), k + 20)
         seen = {}
-        for d, i in zip(dist[0], idx[0]):
-            pid = int(feat_df.iloc[i].player_id)
+        for d, i in zip(dist, idx):
+            pid = int(brute["player_ids"][i])
             if pid == player_id:
                 continue
             # Keep comps aligned with the selectable player list (>= 3 seasons with games played).
@@ -359,10 +687,9 @@ class Store:
                 continue
             # keep the closest season distance per player_id
             if pid not in seen or d < seen[pid]["distance"]:
-                name = self.players_df.loc[self.players_df.player_id == pid, "name"]
                 seen[pid] = {
                     "player_id": pid,
-                    "name": name.iloc[0] if not name.empty else "Unknown",
+                    "name": self._name_by_pid.get(pid, "Unknown"),
                     "distance": float(d),
                 }
             if len(seen) >= k:
@@ -372,47 +699,44 @@ class Store:
             item["similarity_rank"] = idx_rank
         return sorted_res
 
+    def _sim_brute(self) -> dict:
+        """
+        Brute-force kNN state for the per-season similarity rows (the comps
+        fallback when sim_latest is unavailable): the standardized feature
+        matrix and its squared row norms, plus the FAISS index from
+        build_similarity.py when faiss is installed. Built on first use.
+        """
+        if self._sim_brute_state is None:
+            X = np.asarray(self.sim["X"], dtype=np.float64)
+            index_path = self.sim_dir / "index.faiss"
+            self._sim_brute_state = {
+                "X": X,
+                "norms": np.einsum("ij,ij->i", X, X),
+                "player_ids": self.sim["player_ids"],
+                "index": faiss.read_index(str(index_path)) if faiss is not None and index_path.exists() else None,
+            }
+        return self._sim_brute_state
+
     def comps_counting(self, player_id: int, k: int):
+        k = max(k, 1)
         self._ensure_counting_sim()
         if not self.counting_sim:
             raise RuntimeError(f"counting_sim unavailable: {self.counting_sim_error or 'unknown error'}")
-        nn = self.counting_sim["nn"]
-        scaler = self.counting_sim["scaler"]
-        features = self.counting_sim["features"]
         player_ids = self.counting_sim["player_ids"]
-        if player_id not in player_ids:
-            return []
-
-        g = (
-            self.df[(self.df.player_id == player_id) & (self.df.season < 2025) & (self.df.gp > 0)]
-            .sort_values("season")
-            .tail(1)
-        )
-        if g.empty:
+        row = self.counting_sim["row_by_pid"].get(player_id)
+        if row is None:
             return []
-        Xn = scaler.transform(g[features].fillna(0.0))
 
-        dist, idx = nn.kneighbors(Xn, n_neighbors=min(k + 50, len(player_ids)))
-        out = []
-        for d, i in zip(dist[0], idx[0]):
-            pid = int(player_ids[i])
-            if pid == player_id:
-                continue
-            if self.season_count_by_id.get(pid, 0) < 3:
-                continue
-            name = self.players_df.loc[self.players_df.player_id == pid, "name"]
-            out.append(
-                {
-                    "player_id": pid,
-                    "name": name.iloc[0] if not name.empty else "Unknown",
-                    "distance": float(d),
-                }
-            )
-            if len(out) >= k:
-                break
-        for idx_rank, item in enumerate(out, start=1):
-            item["similarity_rank"] = idx_rank
-        return out
+        dist, idx = _comp_neighbors(self.counting_sim, row, k + 50, k)
+        return [
+            {
+                "player_id": player_ids[i],
+                "name": self._name_by_pid.get(player_ids[i], "Unknown"),
+                "distance": float(d),
+                "similarity_rank": rank,
+            }
+            for rank, (d, i) in enumerate(zip(dist.tolist(), idx.tolist()), start=1)
+        ]
 
     def counting_geometry(self, player_id: int, k: int):
         """
@@ -428,16 +752,17 @@ class Store:
         ids = [player_id] + [c["player_id"] for c in comps]
         dist_by_id = {c["player_id"]: c["distance"] for c in comps}
 
-        geometry_by_id = self.counting_sim.get("geometry_by_id") or {}
+        geom_matrix = self.counting_sim["geom_matrix"]
+        geom_row_by_pid = self.counting_sim["row_by_pid"]
 
         def name_for(pid: int) -> str:
-            name = self.players_df.loc[self.players_df.player_id == pid, "name"]
-            return name.iloc[0] if not name.empty else str(pid)
+            return self._name_by_pid.get(pid, str(pid))
 
         def row(pid: int):
-            v = geometry_by_id.get(int(pid))
-            if v is None:
+            i = geom_row_by_pid.get(int(pid))
+            if i is None:
                 return None
+            v = geom_matrix[i]
             # features order is fixed above
             return {
                 "player_id": int(pid),
@@ -464,146 +789,138 @@ class Store:
 
         return {"series": series}
 
-    def _label_for_player_group(self, g: pd.DataFrame) -> tuple[str, str | None, str | None]:
+    def _label_table(self, df: pd.DataFrame) -> pd.DataFrame:
         """
-        Return an "AI-ish" human-readable label based on career peaks/availability.
+        Return an "AI-ish" human-readable label based on career peaks/availability
+        for every player in `df` (one row per player_id: label, rationale, injury_label).
         This is intentionally heuristic and stable (no network/LLM dependency).
         """
-        seasons_played = int(g["season"].nunique())
-
-        # Peaks and averages to avoid bias to last healthy prime year
-        peak_val = g["value_score"].max(skipna=True)
-        peak_impact = g["impact_score"].max(skipna=True)
-        peak_offload = g["off_load"].max(skipna=True)
-        peak_pts75 = g["pts_per75"].max(skipna=True)
-        peak_ts = g["ts_pct"].max(skipna=True)
-        peak_pts_pg = g["pts_per_game"].max(skipna=True)
-        peak_fg3_pg = g["fg3_per_game"].max(skipna=True)
-        peak_reb_pg = g["reb_per_game"].max(skipna=True)
-        peak_ast_pg = g["ast_per_game"].max(skipna=True)
-        peak_stl_pg = g["stl_per_game"].max(skipna=True)
-        peak_blk_pg = g["blk_per_game"].max(skipna=True)
-        peak_stl_blk = (g["stl_per_game"] + g["blk_per_game"]).max(skipna=True)
-        peak_mpg = g["mpg"].max(skipna=True)
-        avg_availability = g["availability"].mean(skipna=True)
-        latest_gp = g.sort_values("season").iloc[-1].gp if not g.empty else 0
-
-        # Defaults if NaN
-        def nz(x, default=0.0):
-            return default if pd.isna(x) else float(x)
-
-        peak_val = nz(peak_val)
-        peak_impact = nz(peak_impact)
-        peak_offload = nz(peak_offload)
-        peak_pts75 = nz(peak_pts75)
-        peak_ts = nz(peak_ts)
-        peak_pts_pg = nz(peak_pts_pg)
-        peak_fg3_pg = nz(peak_fg3_pg)
-        peak_reb_pg = nz(peak_reb_pg)
-        peak_ast_pg = nz(peak_ast_pg)
-        peak_stl_pg = nz(peak_stl_pg)
-        peak_blk_pg = nz(peak_blk_pg)
-        peak_stl_blk = nz(peak_stl_blk)
-        peak_mpg = nz(peak_mpg)
-        avg_availability = nz(avg_availability)
-        latest_gp = nz(latest_gp)
-
-        is_franchise = peak_val > 1.2 and avg_availability > 0.65 and seasons_played >= 8
-        is_star = peak_val > 0.9 and avg_availability > 0.55
-
-        # High-level edge cases
-        if seasons_played <= 2 and latest_gp < 30:
-            return (
-                "Developing prospect",
-                f"{seasons_played} seasons played; latest GP={latest_gp:.0f}",
-            )
-        if avg_availability < 0.35 and (peak_val > 0.6 or peak_offload > 0.35):
-            return (
-                "Injury-limited talent",
-                f"avg availability={avg_availability:.2f}; peak value={peak_val:.2f}",
-            )
-
-        # Archetype signals (peak season)
-        playmaker = peak_ast_pg >= 7.5
-        scorer = peak_pts_pg >= 24.0
-        shooter = peak_fg3_pg >= 2.8
-        rim_protector = peak_blk_pg >= 2.0
-        stopper = peak_stl_pg >= 1.7 and peak_pts_pg < 16.0
-        rebounder = peak_reb_pg >= 11.0
-        three_and_d = peak_fg3_pg >= 1.8 and peak_stl_blk >= 2.0 and peak_pts_pg < 18.0
-        stretch_big = peak_fg3_pg >= 1.6 and peak_reb_pg >= 6.5 and peak_blk_pg < 1.8
-
-        label = "Depth piece"
-        if is_franchise:
-            label = "Franchise cornerstone"
-        elif is_star and playmaker:
-            label = "All-star playmaker"
-        elif is_star and scorer and peak_ts >= 0.56:
-            label = "All-star scorer"
-        elif is_star:
-            label = "Impact star"
-        elif three_and_d:
-            label = "3-and-D wing"
-        elif rim_protector and peak_reb_pg >= 8.0:
-            label = "Rim-protecting anchor"
-        elif rebounder:
-            label = "Glass-cleaning rebounder"
-        elif stretch_big:
-            label = "Stretch big"
-        elif shooter and peak_pts_pg < 18.0:
-            label = "3-point specialist"
-        elif stopper:
-            label = "Defensive stopper"
-        elif peak_offload > 0.4 and avg_availability > 0.4 and peak_pts_pg > 12:
-            label = "Scoring spark plug"
-        elif peak_pts75 > 18 and peak_ts < 0.54:
-            label = "Volume scorer"
-        elif peak_val > 0.6 and avg_availability > 0.55:
-            label = "High-value starter"
-        elif peak_val > 0.3 and avg_availability > 0.45:
-            label = "Reliable role player"
-
-        rationale = (
-            f"peak mpg={peak_mpg:.1f}, pts/g={peak_pts_pg:.1f}, ast/g={peak_ast_pg:.1f}, "
-            f"reb/g={peak_reb_pg:.1f}, 3pm/g={peak_fg3_pg:.1f}, ts%={peak_ts:.3f}, "
-            f"stl+blk={peak_stl_blk:.1f}, peak value={peak_val:.2f}, avg availability={avg_availability:.2f}"
+        num_cols = [
+            "value_score",
+            "impact_score",
+            "off_load",
+            "pts_per75",
+            "ts_pct",
+            "pts_per_game",
+            "fg3_per_game",
+            "reb_per_game",
+            "ast_per_game",
+            "stl_per_game",
+            "blk_per_game",
+            "mpg",
+            "availability",
+            "gp_share",
+            "gp",
+        ]
+        d = df.sort_values(["player_id", "season"])
+        x = d[num_cols].apply(pd.to_numeric, errors="coerce").astype("float64")
+        x["stl_blk"] = x["stl_per_game"] + x["blk_per_game"]
+        # Weight recent seasons higher (rookie/early years often lower minutes/GP).
+        w = d.groupby("player_id").cumcount().to_numpy() + 1.0
+        x["w"] = w
+        x["w_gp_share"] = x["gp_share"].fillna(0) * w
+        x["w_mpg"] = x["mpg"].fillna(0) * w
+        x["player_id"] = d["player_id"].to_numpy()
+        x["season"] = d["season"].to_numpy()
+        grp = x.groupby("player_id", sort=True)
+
+        # Peaks and averages to avoid bias to last healthy prime year; NaN -> 0.
+        peak = grp[num_cols[:12] + ["stl_blk"]].max().fillna(0.0)
+        avg_availability = grp["availability"].mean().fillna(0.0).to_numpy()
+        seasons_played = grp["season"].nunique().to_numpy()
+        latest_gp = x.drop_duplicates("player_id", keep="last")["gp"].fillna(0.0).to_numpy()
+        wsum = grp[["w_gp_share", "w_mpg", "w"]].sum()
+        gp_share_mean = (wsum["w_gp_share"] / wsum["w"]).to_numpy()
+        mp_mean = (wsum["w_mpg"] / wsum["w"]).to_numpy()
+
+        peak_val = peak["value_score"].to_numpy()
+        peak_offload = peak["off_load"].to_numpy()
+        peak_pts75 = peak["pts_per75"].to_numpy()
+        peak_ts = peak["ts_pct"].to_numpy()
+        peak_pts_pg = peak["pts_per_game"].to_numpy()
+        peak_fg3_pg = peak["fg3_per_game"].to_numpy()
+        peak_reb_pg = peak["reb_per_game"].to_numpy()
+        peak_ast_pg = peak["ast_per_game"].to_numpy()
+        peak_stl_pg = peak["stl_per_game"].to_numpy()
+        peak_blk_pg = peak["blk_per_game"].to_numpy()
+        peak_stl_blk = peak["stl_blk"].to_numpy()
+        peak_mpg = peak["mpg"].to_numpy()
+
+        # Edge cases, then archetypes; first matching rule wins.
+        codes = career_label_codes(
+            peak_val,
+            peak_offload,
+            peak_pts75,
+            peak_ts,
+            peak_pts_pg,
+            peak_fg3_pg,
+            peak_reb_pg,
+            peak_ast_pg,
+            peak_stl_pg,
+            peak_blk_pg,
+            peak_stl_blk,
+            avg_availability,
+            seasons_played,
+            latest_gp,
+        )
+        label = np.array(CAREER_LABELS, dtype=object)[codes]
+        rationale = np.array(
+            [
+                f"peak mpg={mpg:.1f}, pts/g={pts:.1f}, ast/g={ast:.1f}, "
+                f"reb/g={reb:.1f}, 3pm/g={fg3:.1f}, ts%={ts:.3f}, "
+                f"stl+blk={sb:.1f}, peak value={val:.2f}, avg availability={av:.2f}"
+                for mpg, pts, ast, reb, fg3, ts, sb, val, av in zip(
+                    peak_mpg.tolist(),
+                    peak_pts_pg.tolist(),
+                    peak_ast_pg.tolist(),
+                    peak_reb_pg.tolist(),
+                    peak_fg3_pg.tolist(),
+                    peak_ts.tolist(),
+                    peak_stl_blk.tolist(),
+                    peak_val.tolist(),
+                    avg_availability.tolist(),
+                )
+            ],
+            dtype=object,
         )
         # Injury/availability classification (tiered)
-        # Weight recent seasons higher (rookie/early years often lower minutes/GP).
-        if "gp_share" in g.columns and "mpg" in g.columns:
-            g_sorted = g.sort_values("season")
-            weights = pd.Series(range(1, len(g_sorted) + 1), index=g_sorted.index)
-            def wmean(series):
-                s = series.fillna(0)
-                return float((s * weights).sum() / weights.sum()) if weights.sum() else 0.0
-            gp_share_mean = wmean(g_sorted["gp_share"])
-            mp_mean = wmean(g_sorted["mpg"])
-        else:
-            gp_share_mean = 0.0
-            mp_mean = 0.0
-        inj_label = "Inconsistent availability"
-        if gp_share_mean >= 0.95 and mp_mean >= 30:
-            inj_label = "Iron Man"
-        elif gp_share_mean >= 0.88 and mp_mean >= 28:
-            inj_label = "Workhorse Durable"
-        elif gp_share_mean >= 0.75 and mp_mean >= 26:
-            inj_label = "Reliable Regular"
-        elif gp_share_mean >= 0.55 and mp_mean >= 24:
-            inj_label = "Load Managed"
-        elif gp_share_mean >= 0.35:
-            inj_label = "Made of Glass"
-        else:
-            inj_label = "Never plays"
+        inj_label = np.select(
+            [
+                (gp_share_mean >= 0.95) & (mp_mean >= 30),
+                (gp_share_mean >= 0.88) & (mp_mean >= 28),
+                (gp_share_mean >= 0.75) & (mp_mean >= 26),
+                (gp_share_mean >= 0.55) & (mp_mean >= 24),
+                gp_share_mean >= 0.35,
+            ],
+            ["Iron Man", "Workhorse Durable", "Reliable Regular", "Load Managed", "Made of Glass"],
+            default="Never plays",
+        ).astype(object)
+
+        # High-level edge cases carry their own rationale and no injury label.
+        for code, why in (
+            (DEVELOPING_PROSPECT, lambda i: f"{seasons_played[i]} seasons played; latest GP={latest_gp[i]:.0f}"),
+            (INJURY_LIMITED, lambda i: f"avg availability={avg_availability[i]:.2f}; peak value={peak_val[i]:.2f}"),
+        ):
+            for i in np.flatnonzero(codes == code):
+                rationale[i], inj_label[i] = why(i), None
 
-        return label, rationale, inj_label
+        return pd.DataFrame(
+            {"label": label, "rationale": rationale, "injury_label": inj_label},
+            index=peak.index,
+        )
 
     def label(self, player_id: int):
-        g = self.df[(self.df.player_id == player_id) & (self.df.season < 2025)]
-        if g.empty:
+        if player_id not in self._label_df.index:
             return {"label": "Unknown", "method": "heuristic"}
-        label, rationale, inj_label = self._label_for_player_group(g)
+        label, rationale, inj_label = self._label_df.loc[player_id]
         return {"label": label, "method": "heuristic", "rationale": rationale, "injury_label": inj_label}
 
+    def label_bytes(self, player_id: int) -> bytes:
+        body = self._labels.get(player_id)
+        if body is None:
+            body = LabelResponse.model_validate(self.label(player_id)).model_dump_json().encode()
+        return body
+
     def label_summary(self):
         """
         Return counts of all labels across the player universe.
@@ -612,14 +929,10 @@ class Store:
         if self._label_summary_cache is not None:
             return self._label_summary_cache
 
-        counts: Counter[str] = Counter()
-        player_ids = self.players_df["player_id"].astype(int).tolist()
-        for pid in player_ids:
-            g = self.df[(self.df.player_id == pid) & (self.df.season < 2025)]
-            if g.empty:
-                continue
-            label, _ = self._label_for_player_group(g)
-            counts[label] += 1
+        # One label per players_df row that has pre-2025 seasons; Counter keeps
+        # first-seen order for ties in most_common().
+        labels = self._label_df["label"].reindex(self.players_df["player_id"]).dropna()
+        counts: Counter[str] = Counter(labels.tolist())
 
         labels = [{"label": k, "count": int(v)} for k, v in counts.most_common()]
         self._label_summary_cache = {"total_players": int(sum(counts.values())), "labels": labels}
@@ -637,9 +950,9 @@ class Store:
         if player_id in self._forecast_cache:
             return self._forecast_cache[player_id]
 
-        g = self.df[(self.df.player_id == player_id) & (self.df.season < 2025) & (self.df.gp > 0)].copy()
-        has_2025 = (self.df[(self.df.player_id == player_id) & (self.df.season == 2025)]).shape[0] > 0
-        if not has_2025 or g.empty:
+        g = self._by_pid_pre2025.get(player_id, self.df.iloc[:0])
+        g = g[g.gp > 0]
+        if player_id not in self._pids_2025 or g.empty:
             self._forecast_cache[player_id] = None
             return None
 
@@ -652,7 +965,7 @@ class Store:
             return None
 
         # Regression to mean of last 2 seasons (weights 0.6 / 0.4)
-        last_two = g.tail(2)["value_score"].fillna(method="ffill").fillna(method="bfill").tolist()
+        last_two = g.tail(2)["value_score"].ffill().bfill().tolist()
         if len(last_two) == 1:
             base = last_two[0]
             trend = 0.0
@@ -665,18 +978,8 @@ class Store:
         age_adj_2025 = 0.0
         age_adj_2026 = 0.0
         if last_age is not None:
-            def age_delta(age):
-                if age < 23:
-                    return 0.05
-                if 23 <= age < 27:
-                    return 0.02
-                if 27 <= age < 30:
-                    return -0.01
-                if 30 <= age < 33:
-                    return -0.04
-                return -0.08
-            age_adj_2025 = age_delta(last_age + 1)  # next season age
-            age_adj_2026 = age_delta(last_age + 2)
+            age_adj_2025 = _age_delta(last_age + 1)  # next season age
+            age_adj_2026 = _age_delta(last_age + 2)
 
         # Volatility-based band: center around median, width from recent std
         vol = float(np.std(vals)) if len(vals) > 1 else 0.08
@@ -702,89 +1005,50 @@ class Store:
 
         series = []
         for pid in ids:
-            g = self.df[(self.df.player_id == pid) & (self.df.season < 2025) & (self.df.gp > 0)]
-            if g.empty:
+            row = self._last_row_by_pid.get(pid)
+            if row is None:
                 continue
-            r = g.sort_values("season").iloc[-1]
-            name = self.players_df.loc[self.players_df.player_id == pid, "name"]
-            series.append(
-                {
-                    "player_id": pid,
-                    "name": name.iloc[0] if not name.empty else str(pid),
-                    "pts_per_game": float(r.pts_per_game) if pd.notna(r.pts_per_game) else None,
-                    "ast_per_game": float(r.ast_per_game) if pd.notna(r.ast_per_game) else None,
-                    "reb_per_game": float(r.reb_per_game) if pd.notna(r.reb_per_game) else None,
-                    "fg3_per_game": float(r.fg3_per_game) if pd.notna(r.fg3_per_game) else None,
-                    "ts_pct": float(r.ts_pct) if pd.notna(r.ts_pct) else None,
-                    "availability": float(r.availability) if pd.notna(r.availability) else None,
-                    "value_score": float(r.value_score) if pd.notna(r.value_score) else None,
-                }
-            )
+            entry = {"player_id": pid, "name": self._name_by_pid.get(pid, str(pid))}
+            for c, values in self._radar_cols.items():
+                v = float(values[row])
+                entry[c] = v if v == v else None
+            series.append(entry)
         return {"series": series}
 
-    def projection(self, player_id: int):
-        g = self.df[(self.df.player_id == player_id) & (self.df.season < 2025)].copy()
-        if g.empty:
-            return []
-        # Only project if the player logged a 2024 season (as requested)
-        g2024 = g[(g.season == 2024) & (g.gp > 0)]
-        if g2024.empty:
+    def radar_bytes(self, player_id: int, k: int) -> bytes:
+        body = self._radar_json.get(player_id, {}).get(k)
+        if body is None:
+            body = RadarResponse.model_validate(self.radar(player_id, k)).model_dump_json().encode()
+        return body
+
+    def projection(self, player_id: int) -> list[ProjectionPointDict]:
+        # Only project if the player logged a 2024 season (as requested); that
+        # row is then also their last pre-2025 season.
+        row = self._last_row_by_pid.get(player_id)
+        if row is None or self._seasons[row] != 2024:
             return []
-        r = g.sort_values("season").iloc[-1]
-        proj = []
-        # Decay factors applied per projected year
-        decay_pts_pg = -0.5
-        decay_ast_pg = -0.2
-        decay_reb_pg = -0.3
-        decay_fg3_pg = -0.1
-        decay_stl_pg = -0.05
-        decay_blk_pg = -0.05
-        decay_tov_pg = -0.05
-        decay_ts = -0.005
-        decay_gp = 0.07  # 7% fewer games per year
-        decay_mp = 0.08  # 8% fewer minutes per year
-
-        # Safe base stats (None if missing)
-        base_gp = float(r.gp) if pd.notna(r.gp) else None
-        base_mpg = float(r["min"]) / float(r.gp) if "min" in r and pd.notna(r["min"]) and pd.notna(r.gp) and r.gp else None
-        base_pts_pg = float(r.pts) / float(r.gp) if pd.notna(r.pts) and pd.notna(r.gp) and r.gp else None
-        base_ast_pg = float(r.ast) / float(r.gp) if pd.notna(r.ast) and pd.notna(r.gp) and r.gp else None
-        base_reb_pg = float(r.reb) / float(r.gp) if pd.notna(r.reb) and pd.notna(r.gp) and r.gp else None
-        base_fg3_pg = float(r.fg3m) / float(r.gp) if pd.notna(r.fg3m) and pd.notna(r.gp) and r.gp else None
-        base_fg_pct = float(r.fgm) / float(r.fga) if pd.notna(r.fgm) and pd.notna(r.fga) and r.fga else None
-        base_ft_pct = float(r.ftm) / float(r.fta) if pd.notna(r.ftm) and pd.notna(r.fta) and r.fta else None
-        base_stl_pg = float(r.stl) / float(r.gp) if pd.notna(r.stl) and pd.notna(r.gp) and r.gp else None
-        base_blk_pg = float(r.blk) / float(r.gp) if pd.notna(r.blk) and pd.notna(r.gp) and r.gp else None
-        base_tov_pg = float(r.tov) / float(r.gp) if pd.notna(r.tov) and pd.notna(r.gp) and r.gp else None
-        base_ts = float(r.ts_pct) if pd.notna(r.ts_pct) else None
-
-        for i in range(1, 6):
-            gp_pred = None
-            if base_gp is not None:
-                gp_pred = max(10, float(base_gp * (1 - decay_gp * i)))
-            mpg_pred = None
-            if base_mpg is not None:
-                mpg_pred = max(5, float(base_mpg * (1 - decay_mp * i)))
-
-            proj.append(
-                {
-                    "season": int(r.season + i),
-                    "age": float(r.player_age + i) if pd.notna(r.player_age) else None,
-                    "gp_pred": gp_pred,
-                    "mpg_pred": mpg_pred,
-                    "pts_per_game_pred": None if base_pts_pg is None else max(0, float(base_pts_pg + decay_pts_pg * i)),
-                    "ast_per_game_pred": None if base_ast_pg is None else max(0, float(base_ast_pg + decay_ast_pg * i)),
-                    "reb_per_game_pred": None if base_reb_pg is None else max(0, float(base_reb_pg + decay_reb_pg * i)),
-                    "fg3_per_game_pred": None if base_fg3_pg is None else max(0, float(base_fg3_pg + decay_fg3_pg * i)),
-                    "fg_pct_pred": base_fg_pct,
-                    "ft_pct_pred": base_ft_pct,
-                    "stl_per_game_pred": None if base_stl_pg is None else max(0, float(base_stl_pg + decay_stl_pg * i)),
-                    "blk_per_game_pred": None if base_blk_pg is None else max(0, float(base_blk_pg + decay_blk_pg * i)),
-                    "tov_per_game_pred": None if base_tov_pg is None else max(0, float(base_tov_pg + decay_tov_pg * i)),
-                    "ts_pct_pred": None if base_ts is None else max(0, float(base_ts + decay_ts * i)),
-                }
-            )
-        return proj
+        # Missing stats as None so equal inputs hit the same _project cache entry.
+        base = tuple(None if v != v else v for v in self._projection_inputs[row].tolist())
+        return _project(2024, base)
+
+    def projection_bytes(self, player_id: int) -> bytes:
+        body = self._proj_json.get(player_id)
+        if body is None:
+            body = orjson.dumps(self.projection(player_id))
+            if player_id in self._last_row_by_pid:
+                self._proj_json[player_id] = body
+        return body
+
+    def comps_bytes(self, player_id: int, k: int) -> bytes:
+        return SimilarPlayerListAdapter.dump_json(SimilarPlayerListAdapter.validate_python(self.comps(player_id, k)))
+
+    def cache_clear(self):
+        """Drop memoized per-player results (startup-precomputed payloads are kept)."""
+        for fn in (self.comps, self.comps_counting, self.counting_geometry, self.radar, _project):
+            fn.cache_clear()
+        self._forecast_cache.clear()
+        self._traj_json.clear()
+        self._proj_json.clear()
 
 
 store = Store()
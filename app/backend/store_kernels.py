@@ -0,0 +1,184 @@
+"""
+Numba kernels for the Store's numeric hot loops.
+
+Kernels are compiled on first call and cached next to the module
+(cache=True), so only the first start after a code change pays the JIT cost.
+"""
+import numpy as np
+from numba import njit, prange
+
+
+@njit(cache=True, parallel=True, fastmath=True)
+def pairwise_euclidean(Q: np.ndarray, X: np.ndarray) -> np.ndarray:
+    """
+    Euclidean distance from every row of Q to every row of X, written straight
+    into a float32 (len(Q), len(X)) matrix with rows split across cores.
+    """
+    n, m, d = Q.shape[0], X.shape[0], Q.shape[1]
+    out = np.empty((n, m), dtype=np.float32)
+    for i in prange(n):
+        for j in range(m):
+            acc = 0.0
+            for f in range(d):
+                diff = Q[i, f] - X[j, f]
+                acc += diff * diff
+            out[i, j] = np.sqrt(acc)
+    return out
+
+
+# Career label per code written by career_label_codes (rule order).
+CAREER_LABELS = (
+    "Depth piece",
+    "Franchise cornerstone",
+    "All-star playmaker",
+    "All-star scorer",
+    "Impact star",
+    "3-and-D wing",
+    "Rim-protecting anchor",
+    "Glass-cleaning rebounder",
+    "Stretch big",
+    "3-point specialist",
+    "Defensive stopper",
+    "Scoring spark plug",
+    "Volume scorer",
+    "High-value starter",
+    "Reliable role player",
+    "Developing prospect",
+    "Injury-limited talent",
+)
+DEVELOPING_PROSPECT = CAREER_LABELS.index("Developing prospect")
+INJURY_LIMITED = CAREER_LABELS.index("Injury-limited talent")
+
+
+@njit(cache=True, parallel=True)
+def career_label_codes(
+    peak_val,
+    peak_offload,
+    peak_pts75,
+    peak_ts,
+    peak_pts_pg,
+    peak_fg3_pg,
+    peak_reb_pg,
+    peak_ast_pg,
+    peak_stl_pg,
+    peak_blk_pg,
+    peak_stl_blk,
+    avg_availability,
+    seasons_played,
+    latest_gp,
+):
+    """
+    Career label decision per player as a uint8 index into CAREER_LABELS.
+    Inputs are per-player aggregates with missing values already set to 0;
+    the first matching rule wins, edge cases first.
+    """
+    n = peak_val.shape[0]
+    out = np.zeros(n, dtype=np.uint8)
+    for i in prange(n):
+        val = peak_val[i]
+        avail = avg_availability[i]
+        pts = peak_pts_pg[i]
+        fg3 = peak_fg3_pg[i]
+        reb = peak_reb_pg[i]
+        blk = peak_blk_pg[i]
+
+        if seasons_played[i] <= 2 and latest_gp[i] < 30:
+            out[i] = DEVELOPING_PROSPECT
+            continue
+        if avail < 0.35 and (val > 0.6 or peak_offload[i] > 0.35):
+            out[i] = INJURY_LIMITED
+            continue
+
+        is_franchise = val > 1.2 and avail > 0.65 and seasons_played[i] >= 8
+        is_star = val > 0.9 and avail > 0.55
+        if is_franchise:
+            out[i] = 1
+        elif is_star and peak_ast_pg[i] >= 7.5:
+            out[i] = 2
+        elif is_star and pts >= 24.0 and peak_ts[i] >= 0.56:
+            out[i] = 3
+        elif is_star:
+            out[i] = 4
+        elif fg3 >= 1.8 and peak_stl_blk[i] >= 2.0 and pts < 18.0:
+            out[i] = 5
+        elif blk >= 2.0 and reb >= 8.0:
+            out[i] = 6
+        elif reb >= 11.0:
+            out[i] = 7
+        elif fg3 >= 1.6 and reb >= 6.5 and blk < 1.8:
+            out[i] = 8
+        elif fg3 >= 2.8 and pts < 18.0:
+            out[i] = 9
+        elif peak_stl_pg[i] >= 1.7 and pts < 16.0:
+            out[i] = 10
+        elif peak_offload[i] > 0.4 and avail > 0.4 and pts > 12:
+            out[i] = 11
+        elif peak_pts75[i] > 18 and peak_ts[i] < 0.54:
+            out[i] = 12
+        elif val > 0.6 and avail > 0.55:
+            out[i] = 13
+        elif val > 0.3 and avail > 0.45:
+            out[i] = 14
+    return out
+
+
+# Column order of project_kernel's output (one row per projected year).
+PROJECTION_FIELDS = (
+    "age",
+    "gp_pred",
+    "mpg_pred",
+    "pts_per_game_pred",
+    "ast_per_game_pred",
+    "reb_per_game_pred",
+    "fg3_per_game_pred",
+    "fg_pct_pred",
+    "ft_pct_pred",
+    "stl_per_game_pred",
+    "blk_per_game_pred",
+    "tov_per_game_pred",
+    "ts_pct_pred",
+)
+
+
+@njit(cache=True)
+def _rate(num, den):
+    # NaN for a missing value or a zero denominator.
+    if den != 0:
+        return num / den
+    return np.nan
+
+
+@njit(cache=True)
+def project_kernel(age, gp, minutes, pts, ast, reb, fg3m, fgm, fga, ftm, fta, stl, blk, tov, ts):
+    """
+    5-year projection from last-season totals as a (5, len(PROJECTION_FIELDS))
+    float64 array. Missing inputs are NaN and stay NaN in every value they feed.
+    """
+    mpg = _rate(minutes, gp)
+    pts_pg = _rate(pts, gp)
+    ast_pg = _rate(ast, gp)
+    reb_pg = _rate(reb, gp)
+    fg3_pg = _rate(fg3m, gp)
+    fg_pct = _rate(fgm, fga)
+    ft_pct = _rate(ftm, fta)
+    stl_pg = _rate(stl, gp)
+    blk_pg = _rate(blk, gp)
+    tov_pg = _rate(tov, gp)
+
+    out = np.empty((5, 13), dtype=np.float64)
+    for row in range(5):
+        i = row + 1.0
+        out[row, 0] = age + i
+        out[row, 1] = np.maximum(10.0, gp * (1 - 0.07 * i))  # 7% fewer games per year
+        out[row, 2] = np.maximum(5.0, mpg * (1 - 0.08 * i))  # 8% fewer minutes per year
+        out[row, 3] = np.maximum(0.0, pts_pg + -0.5 * i)
+        out[row, 4] = np.maximum(0.0, ast_pg + -0.2 * i)
+        out[row, 5] = np.maximum(0.0, reb_pg + -0.3 * i)
+        out[row, 6] = np.maximum(0.0, fg3_pg + -0.1 * i)
+        out[row, 7] = fg_pct
+        out[row, 8] = ft_pct
+        out[row, 9] = np.maximum(0.0, stl_pg + -0.05 * i)
+        out[row, 10] = np.maximum(0.0, blk_pg + -0.05 * i)
+        out[row, 11] = np.maximum(0.0, tov_pg + -0.05 * i)
+        out[row, 12] = np.maximum(0.0, ts + -0.005 * i)
+    return out
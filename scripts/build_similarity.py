@@ -1,8 +1,32 @@
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from sklearn.preprocessing import StandardScaler
-from sklearn.neighbors import NearestNeighbors
-import joblib
+
+try:
+    import faiss
+except ImportError:  # faiss is optional; without it no index file is written
+    faiss = None
+
+# "ivfpq": product-quantized index, one 8-bit code per feature (5 bytes/row
+# instead of 20); "flat": exact L2 over the float32 rows.
+FAISS_INDEX = "ivfpq"
+IVF_LISTS = 64
+IVF_PROBE = 16
+
+
+def write_faiss_index(Xn: np.ndarray, path: Path):
+    d = Xn.shape[1]
+    if FAISS_INDEX == "flat":
+        index = faiss.IndexFlatL2(d)
+    else:
+        quantizer = faiss.IndexFlatL2(d)
+        index = faiss.IndexIVFPQ(quantizer, d, IVF_LISTS, d, 8)
+        index.train(Xn)
+        # Saved with the index, so searches probe this many lists by default.
+        index.nprobe = IVF_PROBE
+    index.add(Xn)
+    faiss.write_index(index, str(path))
 
 
 def main():
@@ -17,13 +41,17 @@ def main():
     scaler = StandardScaler().fit(X)
     Xn = scaler.transform(X)
 
-    nn = NearestNeighbors(n_neighbors=6, metric="euclidean").fit(Xn)
-    Path("models").mkdir(exist_ok=True)
-    joblib.dump(
-        {"scaler": scaler, "nn": nn, "feature_df": feat_df[["player_id", "season"] + features], "features": features},
-        "models/similarity.pkl",
-    )
-    print("Saved models/similarity.pkl")
+    # Plain columnar/array artifacts: the backend memory-maps Xn.npy and reads
+    # the id columns from the parquet, with no pickled objects to rebuild.
+    out_dir = Path("models/similarity")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    feat_df[["player_id", "season"] + features].to_parquet(out_dir / "feature_df.parquet", index=False, compression="zstd")
+    np.save(out_dir / "Xn.npy", Xn.astype(np.float32))
+    np.save(out_dir / "scaler_mean.npy", scaler.mean_)
+    np.save(out_dir / "scaler_scale.npy", scaler.scale_)
+    if faiss is not None:
+        write_faiss_index(np.ascontiguousarray(Xn, dtype=np.float32), out_dir / "index.faiss")
+    print(f"Saved similarity artifacts to {out_dir}/")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,9 @@
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import lxml.html
 import pandas as pd
 import requests  # NEW
 
@@ -14,34 +17,65 @@ RAW_DIR.mkdir(parents=True, exist_ok=True)
 START_YEAR = 1980
 END_YEAR = 2024  # last completed NBA season
 
-all_seasons = []
+# Be polite: at most one request every REQUEST_INTERVAL seconds across all
+# workers; parsing overlaps with the next downloads.
+MAX_WORKERS = 4
+REQUEST_INTERVAL = 1.5
 
-for year in range(START_YEAR, END_YEAR + 1):
-    url = f"https://www.basketball-reference.com/leagues/NBA_{year}_per_game.html"
-    print(f"Downloading season {year} from {url} ...")
-
-    try:
-        # --- Use requests to handle HTTPS + certificates ---
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()  # raise if HTTP error
+_rate_lock = threading.Lock()
+_next_request_at = 0.0
 
-        # Pass HTML content directly to pandas
-        tables = pd.read_html(response.text)
-        df = tables[0]
 
-        # Remove repeated header rows inside the table
-        df = df[df["Rk"] != "Rk"]
+def wait_for_slot():
+    """Block until this thread may send the next request (shared pacing)."""
+    global _next_request_at
+    with _rate_lock:
+        now = time.monotonic()
+        start = max(now, _next_request_at)
+        _next_request_at = start + REQUEST_INTERVAL
+    time.sleep(start - now)
 
-        # Add season column
-        df["season"] = year
 
-        all_seasons.append(df)
-
-        # Be polite: avoid rapid-fire requests
-        time.sleep(2)
+def fetch_year(year: int) -> pd.DataFrame:
+    url = f"https://www.basketball-reference.com/leagues/NBA_{year}_per_game.html"
+    wait_for_slot()
+    print(f"Downloading season {year} from {url} ...")
 
-    except Exception as e:
-        print(f"Failed to process {year}: {e}")
+    # --- Use requests to handle HTTPS + certificates ---
+    response = requests.get(url, timeout=10)
+    response.raise_for_status()  # raise if HTTP error
+
+    # Parse the per-game table straight from the HTML: column names from the
+    # header row, one list of cell texts per data row. Repeated header rows
+    # inside the body have no <td> cells, so [td] already skips them.
+    table = lxml.html.fromstring(response.text).xpath('//table[@id="per_game_stats"]')[0]
+    columns = [th.text_content().strip() for th in table.xpath("./thead/tr[last()]/th")]
+    rows = [[cell.text_content().strip() for cell in tr.xpath("./th|./td")] for tr in table.xpath(".//tr[td]")]
+    df = pd.DataFrame(rows, columns=columns).replace("", None)
+
+    # Numeric columns as numbers (as read_html inferred them); text stays text.
+    for col in df.columns:
+        values = pd.to_numeric(df[col], errors="coerce")
+        if values.notna().sum() == df[col].notna().sum():
+            df[col] = values
+
+    # Add season column
+    df["season"] = year
+    return df
+
+
+seasons_by_year = {}
+with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+    futures = {executor.submit(fetch_year, year): year for year in range(START_YEAR, END_YEAR + 1)}
+    for future in as_completed(futures):
+        year = futures[future]
+        try:
+            seasons_by_year[year] = future.result()
+        except Exception as e:
+            print(f"Failed to process {year}: {e}")
+
+# Keep the combined file in season order regardless of completion order.
+all_seasons = [seasons_by_year[year] for year in sorted(seasons_by_year)]
 
 if not all_seasons:
     print("No data was downloaded. Exiting.")
@@ -9,12 +9,16 @@ Slow + safe downloader:
 - Resumes automatically by skipping already-saved PLAYER_IDs
 """
 
+import queue
+import threading
 import time
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional, Dict
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from nba_api.stats.endpoints import commonallplayers, playercareerstats
 
 # ---------------- CONFIG ---------------- #
@@ -25,22 +29,32 @@ MAX_RETRIES = 3
 SLEEP_AFTER_SUCCESS = 0.6  # sleep after each successful player
 RETRY_SLEEP = 2.4        # sleep between retries on failure
 OUTPUT_FILE = Path("data/raw/career_stats_2000_onward.csv")
+CACHE_DIR = Path("data/cache/careerstats")  # raw API response per PLAYER_ID
+CACHE_TTL_DAYS = 7       # re-download cached responses older than this
 # ---------------------------------------- #
 
 
 def get_players_since_2000() -> pd.DataFrame:
     """Fetch full player list and filter to FROM_YEAR >= 2000."""
     print("Fetching full NBA player list...")
-    players_df = commonallplayers.CommonAllPlayers(
+    # Raw JSON result set straight into Arrow columns (skips nba_api's
+    # row-by-row DataFrame build).
+    result = commonallplayers.CommonAllPlayers(
         is_only_current_season=0,
         league_id="00"
-    ).get_data_frames()[0]
-
-    players_df["FROM_YEAR"] = pd.to_numeric(players_df["FROM_YEAR"], errors="coerce")
-    filtered = players_df[players_df["FROM_YEAR"] >= FROM_YEAR_FILTER].copy()
-    filtered = filtered.reset_index(drop=True)
-
-    print(f"Total players: {len(players_df)} | Players since 2000: {len(filtered)}")
+    ).get_dict()["resultSets"][0]
+    rows = result["rowSet"]
+    columns = zip(*rows) if rows else [[] for _ in result["headers"]]
+    players = pa.Table.from_arrays([pa.array(list(col)) for col in columns], names=result["headers"])
+
+    # FROM_YEAR arrives as text; anything non-numeric becomes null.
+    from_year = players["FROM_YEAR"]
+    if pa.types.is_string(from_year.type):
+        from_year = pc.cast(pc.if_else(pc.utf8_is_digit(from_year), from_year, None), pa.int64())
+    players = players.set_column(players.schema.get_field_index("FROM_YEAR"), "FROM_YEAR", from_year)
+    filtered = players.filter(pc.greater_equal(from_year, FROM_YEAR_FILTER)).to_pandas()
+
+    print(f"Total players: {players.num_rows} | Players since 2000: {len(filtered)}")
     return filtered
 
 
@@ -59,10 +73,32 @@ def load_existing_players() -> set:
         return set()
 
 
-def append_to_csv(df: pd.DataFrame):
-    """Append a chunk of rows to the master CSV file."""
-    header = not OUTPUT_FILE.exists()  # write header only if file is new
-    df.to_csv(OUTPUT_FILE, mode="a", header=header, index=False)
+def csv_writer(chunks: queue.Queue, errors: list):
+    """
+    Single writer thread: append each queued chunk of rows to the master CSV
+    through one open file handle, until a None sentinel arrives. A write
+    failure is stored in `errors` for the main thread to re-raise.
+    """
+    try:
+        header = not OUTPUT_FILE.exists() or OUTPUT_FILE.stat().st_size == 0  # write header only if file is new
+        with open(OUTPUT_FILE, "a", newline="") as f:
+            while True:
+                df = chunks.get()
+                if df is None:
+                    break
+                df.to_csv(f, header=header, index=False)
+                header = False
+                # Flush per player so an interrupted run still resumes from what was saved.
+                f.flush()
+    except BaseException as e:
+        errors.append(e)
+
+
+def load_cached(path: Path) -> Optional[pd.DataFrame]:
+    """Return a cached response if it exists and is younger than CACHE_TTL_DAYS."""
+    if path.exists() and time.time() - path.stat().st_mtime < CACHE_TTL_DAYS * 86400:
+        return pd.read_parquet(path)
+    return None
 
 
 def fetch_single_player(info: Dict, already_done: set) -> Optional[pd.DataFrame]:
@@ -75,26 +111,35 @@ def fetch_single_player(info: Dict, already_done: set) -> Optional[pd.DataFrame]
         print(f"[{pos}/{total}] Skipping {player_name} ({player_id}) — already saved.")
         return None
 
-    print(f"[{pos}/{total}] Fetching {player_name} ({player_id})...")
-
-    retries = 0
-    df = pd.DataFrame()
-
-    while retries < MAX_RETRIES:
-        try:
-            career = playercareerstats.PlayerCareerStats(
-                player_id=player_id,
-                timeout=60,
-            )
-            df = career.get_data_frames()[0]
-            break
-        except Exception as e:
-            retries += 1
-            print(f"  -> Retry {retries}/{MAX_RETRIES} failed for {player_name}: {e}")
-            if retries >= MAX_RETRIES:
-                print(f"  -> FAILED for {player_name}. Skipping.")
-                return None
-            time.sleep(RETRY_SLEEP)
+    cache_path = CACHE_DIR / f"{player_id}.parquet"
+    df = load_cached(cache_path)
+    fetched = df is None
+
+    if fetched:
+        print(f"[{pos}/{total}] Fetching {player_name} ({player_id})...")
+        retries = 0
+        df = pd.DataFrame()
+
+        while retries < MAX_RETRIES:
+            try:
+                career = playercareerstats.PlayerCareerStats(
+                    player_id=player_id,
+                    timeout=60,
+                )
+                df = career.get_data_frames()[0]
+                break
+            except Exception as e:
+                retries += 1
+                print(f"  -> Retry {retries}/{MAX_RETRIES} failed for {player_name}: {e}")
+                if retries >= MAX_RETRIES:
+                    print(f"  -> FAILED for {player_name}. Skipping.")
+                    return None
+                time.sleep(RETRY_SLEEP)
+
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(cache_path, index=False)
+    else:
+        print(f"[{pos}/{total}] {player_name} ({player_id}) from cache.")
 
     if df.empty:
         print(f"  -> No stats for {player_name}.")
@@ -111,7 +156,8 @@ def fetch_single_player(info: Dict, already_done: set) -> Optional[pd.DataFrame]
     df["PLAYER_ID"] = player_id
     df["PLAYER_NAME"] = player_name
 
-    time.sleep(SLEEP_AFTER_SUCCESS)
+    if fetched:
+        time.sleep(SLEEP_AFTER_SUCCESS)
     return df
 
 
@@ -143,13 +189,44 @@ def fetch_player_seasons_multithread(players_df: pd.DataFrame):
             "player_name": row["DISPLAY_FIRST_LAST"],
         })
 
-    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
-        futures = {executor.submit(fetch_single_player, job, existing): job for job in jobs}
+    # Workers hand finished frames to one writer thread; the bounded queue
+    # applies backpressure if writing falls behind.
+    chunks = queue.Queue(maxsize=2 * MAX_WORKERS)
+    writer_errors = []
+    writer = threading.Thread(target=csv_writer, args=(chunks, writer_errors), daemon=True)
+    writer.start()
+
+    def put_chunk(item):
+        # Nothing drains the queue once the writer dies, so never block on it.
+        while writer.is_alive():
+            try:
+                chunks.put(item, timeout=1)
+                return
+            except queue.Full:
+                continue
+        raise RuntimeError("CSV writer thread stopped") from (writer_errors[0] if writer_errors else None)
+
+    def fetch_and_queue(job: Dict):
+        df_chunk = fetch_single_player(job, existing)
+        if df_chunk is not None and not df_chunk.empty:
+            put_chunk(df_chunk)
 
-        for future in as_completed(futures):
-            df_chunk = future.result()
-            if df_chunk is not None and not df_chunk.empty:
-                append_to_csv(df_chunk)
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(fetch_and_queue, job) for job in jobs]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        if writer.is_alive():
+            put_chunk(None)
+        writer.join()
+        if writer_errors:
+            raise writer_errors[0]
 
 
 def main():
@@ -3,6 +3,7 @@ Enrich player positions and save to data/clean/player_positions.parquet.
 Uses commonplayerinfo for every player_id (static players listing does not include position).
 Run once with network enabled; respects a small pause to avoid rate limits.
 """
+import asyncio
 import time
 from pathlib import Path
 
@@ -10,6 +11,9 @@ import pandas as pd
 from nba_api.stats.endpoints import commonplayerinfo
 from nba_api.stats.library.parameters import LeagueID
 
+# Requests in flight at once (each still pauses after its fetch).
+MAX_CONCURRENCY = 5
+
 
 def fetch_position_api(player_id: int, pause: float = 0.6) -> str | None:
     try:
@@ -24,6 +28,19 @@ def fetch_position_api(player_id: int, pause: float = 0.6) -> str | None:
         return None
 
 
+async def fetch_positions(player_ids: list[int]) -> list[str | None]:
+    """Positions for player_ids (same order), with up to MAX_CONCURRENCY requests in flight."""
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def worker(idx: int, pid_int: int) -> str | None:
+        async with sem:
+            pos = await asyncio.to_thread(fetch_position_api, pid_int)
+        print(f"{idx}/{len(player_ids)} player_id={pid_int} position={pos}")
+        return pos
+
+    return await asyncio.gather(*(worker(idx, pid) for idx, pid in enumerate(player_ids, 1)))
+
+
 def main():
     root = Path(__file__).resolve().parents[1]
     parquet_path = root / "data/clean/player_seasons.parquet"
@@ -31,19 +48,12 @@ def main():
         raise FileNotFoundError(f"Missing {parquet_path}, run prepare_player_seasons.py first.")
 
     df = pd.read_parquet(parquet_path)
-    player_ids = sorted(df["player_id"].unique())
-
-    out = []
-    fetched_api = 0
-    for idx, pid in enumerate(player_ids, 1):
-        pid_int = int(pid)
-        pos = fetch_position_api(pid_int)
-        if pos:
-            fetched_api += 1
-        out.append({"player_id": pid_int, "primary_position": pos})
-        print(f"{idx}/{len(player_ids)} player_id={pid_int} position={pos}")
+    player_ids = [int(pid) for pid in sorted(df["player_id"].unique())]
+
+    positions = asyncio.run(fetch_positions(player_ids))
+    fetched_api = sum(1 for pos in positions if pos)
 
-    out_df = pd.DataFrame(out)
+    out_df = pd.DataFrame({"player_id": player_ids, "primary_position": positions})
     out_path = root / "data/clean/player_positions.parquet"
     out_path.parent.mkdir(parents=True, exist_ok=True)
     out_df.to_parquet(out_path, index=False)
@@ -10,6 +10,8 @@
 # Set the absolute paths below before running.
 
 from pathlib import Path
+import asyncio
+import json
 import time
 import pandas as pd
 from nba_api.stats.endpoints import commonplayerinfo
@@ -25,8 +27,13 @@ OUT_PERMANENT_CSV = "/Users/alexmackenzie/projects/nba-career-analytics/data/cle
 START_FROM_INDEX = 1200
 # Skip player_ids already present in OUT_PERMANENT_CSV and OUT_DYNAMIC_CSV.
 SKIP_EXISTING = True
+# Raw commonplayerinfo response per player_id; reused while younger than CACHE_TTL_DAYS.
+CACHE_DIR = "/Users/alexmackenzie/projects/nba-career-analytics/data/cache/playerinfo"
+CACHE_TTL_DAYS = 7
 # Pause between requests (seconds) to reduce rate-limit/timeouts.
 PAUSE_SECONDS = 0.3
+# Requests in flight at once (each still pauses PAUSE_SECONDS after its fetch).
+MAX_CONCURRENCY = 5
 
 
 def load_player_ids(path: str) -> pd.Series:
@@ -45,8 +52,14 @@ def load_existing_ids(path: str) -> set[int]:
 
 
 def fetch_player(pid: int, pause: float) -> dict:
-    info = commonplayerinfo.CommonPlayerInfo(player_id=pid).get_normalized_dict()["CommonPlayerInfo"][0]
-    time.sleep(pause)  # be gentle to the API
+    cache_path = Path(CACHE_DIR) / f"{pid}.json"
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < CACHE_TTL_DAYS * 86400:
+        info = json.loads(cache_path.read_text())
+    else:
+        info = commonplayerinfo.CommonPlayerInfo(player_id=pid).get_normalized_dict()["CommonPlayerInfo"][0]
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps(info))
+        time.sleep(pause)  # be gentle to the API
     return {
         "player_id": pid,
         "name": info.get("DISPLAY_FIRST_LAST"),
@@ -56,6 +69,46 @@ def fetch_player(pid: int, pause: float) -> dict:
     }
 
 
+def append_dynamic(info: dict) -> None:
+    pd.DataFrame([info]).to_csv(
+        OUT_DYNAMIC_CSV,
+        mode="a",
+        header=not Path(OUT_DYNAMIC_CSV).exists(),
+        index=False,
+    )
+
+
+async def fetch_all(ids, existing: set[int], original_total: int) -> int:
+    """Fetch bio info for ids with up to MAX_CONCURRENCY requests in flight; returns rows appended."""
+    sem = asyncio.Semaphore(MAX_CONCURRENCY)
+    write_lock = asyncio.Lock()
+    wrote = 0
+
+    async def worker(idx: int, pid_int: int):
+        nonlocal wrote
+        try:
+            async with sem:
+                info = await asyncio.to_thread(fetch_player, pid_int, PAUSE_SECONDS)
+            # Append row immediately so we don't lose progress if interrupted.
+            async with write_lock:
+                await asyncio.to_thread(append_dynamic, info)
+                existing.add(pid_int)
+                wrote += 1
+            print(f"[{idx}/{original_total}] {info['name']} pos={info['position']} height={info['height']} weight={info['weight']}")
+        except Exception as e:
+            print(f"[{idx}/{original_total}] player_id={pid_int} FAILED: {e}")
+
+    jobs = []
+    for idx, pid in enumerate(ids, START_FROM_INDEX):
+        pid_int = int(pid)
+        if SKIP_EXISTING and pid_int in existing:
+            print(f"[{idx}/{original_total}] player_id={pid_int} SKIP (already saved)")
+            continue
+        jobs.append(worker(idx, pid_int))
+    await asyncio.gather(*jobs, return_exceptions=True)
+    return wrote
+
+
 def main():
     # Ensure output dirs exist
     Path(OUT_DYNAMIC_CSV).parent.mkdir(parents=True, exist_ok=True)
@@ -71,26 +124,7 @@ def main():
         existing |= load_existing_ids(OUT_PERMANENT_CSV)
         existing |= load_existing_ids(OUT_DYNAMIC_CSV)
 
-    wrote_dynamic = 0
-    for idx, pid in enumerate(ids, START_FROM_INDEX):
-        pid_int = int(pid)
-        if SKIP_EXISTING and pid_int in existing:
-            print(f"[{idx}/{original_total}] player_id={pid_int} SKIP (already saved)")
-            continue
-        try:
-            info = fetch_player(pid_int, pause=PAUSE_SECONDS)
-            # Append row immediately so we don't lose progress if interrupted.
-            pd.DataFrame([info]).to_csv(
-                OUT_DYNAMIC_CSV,
-                mode="a",
-                header=not Path(OUT_DYNAMIC_CSV).exists(),
-                index=False,
-            )
-            existing.add(pid_int)
-            wrote_dynamic += 1
-            print(f"[{idx}/{original_total}] {info['name']} pos={info['position']} height={info['height']} weight={info['weight']}")
-        except Exception as e:
-            print(f"[{idx}/{original_total}] player_id={pid_int} FAILED: {e}")
+    wrote_dynamic = asyncio.run(fetch_all(ids, existing, original_total))
 
     # Merge dynamic into permanent (dedupe by player_id).
     try:
@@ -1,48 +1,37 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 from pathlib import Path
 
 def main():
-    raw = pd.read_csv("/Users/alexmackenzie/projects/nba-career-analytics/data/raw/career_stats_2000_onward.csv")
-    players = pd.read_csv("/Users/alexmackenzie/projects/nba-career-analytics/data/raw/players_2000_onward.csv")
+    raw = pd.read_csv("/Users/alexmackenzie/projects/nba-career-analytics/data/raw/career_stats_2000_onward.csv", engine="pyarrow")
+    players = pd.read_csv("/Users/alexmackenzie/projects/nba-career-analytics/data/raw/players_2000_onward.csv", engine="pyarrow")
     raw.columns = raw.columns.str.lower()
+    # Low-cardinality team codes as a categorical: the TOT mask, dedupe and
+    # sort below run on integer codes (categories are in lexical order).
+    raw["team_abbreviation"] = raw["team_abbreviation"].astype("category")
     players.columns = players.columns.str.lower()
     players = players.rename(columns={"person_id": "player_id", "display_first_last": "player_name"})
     players["player_id"] = players["player_id"].astype(int)
 
-    rows = []
-    for (pid, season), g in raw.groupby(["player_id", "season_id"]):
-        if (g["team_abbreviation"] == "TOT").any():
-            # If a TOT row exists, use it directly (it already represents the season total).
-            row = g[g["team_abbreviation"] == "TOT"].iloc[0].copy()
-        else:
-            # Otherwise aggregate the team rows once.
-            row = {
-                "player_id": pid,
-                "season_id": season,
-                "team_abbreviation": ",".join(sorted(set(g["team_abbreviation"]))),
-                "player_age": g["player_age"].mean(),
-                "gp": g["gp"].sum(),
-                "min": g["min"].sum(),
-                "fgm": g["fgm"].sum(),
-                "fga": g["fga"].sum(),
-                "fg3m": g["fg3m"].sum(),
-                "fg3a": g["fg3a"].sum(),
-                "ftm": g["ftm"].sum(),
-                "fta": g["fta"].sum(),
-                "oreb": g["oreb"].sum(),
-                "dreb": g["dreb"].sum(),
-                "reb": g["reb"].sum(),
-                "ast": g["ast"].sum(),
-                "stl": g["stl"].sum(),
-                "blk": g["blk"].sum(),
-                "tov": g["tov"].sum(),
-                "pf": g["pf"].sum(),
-                "pts": g["pts"].sum(),
-            }
-            row = pd.Series(row)
-        rows.append(row)
+    keys = ["player_id", "season_id"]
+    sum_cols = [
+        "gp", "min", "fgm", "fga", "fg3m", "fg3a", "ftm", "fta",
+        "oreb", "dreb", "reb", "ast", "stl", "blk", "tov", "pf", "pts",
+    ]
+    # If a TOT row exists, use it directly (it already represents the season total).
+    tot = raw[raw["team_abbreviation"].eq("TOT")].drop_duplicates(keys)
+    has_tot = pd.MultiIndex.from_frame(raw[keys]).isin(pd.MultiIndex.from_frame(tot[keys]))
+    # Otherwise aggregate the team rows once.
+    teams = raw[~has_tot]
+    summed = teams.groupby(keys).agg({"player_age": "mean", **{c: "sum" for c in sum_cols}})
+    teams_played = teams.drop_duplicates(keys + ["team_abbreviation"]).sort_values("team_abbreviation")
+    summed["team_abbreviation"] = (
+        teams_played["team_abbreviation"].astype(str).groupby([teams_played[k] for k in keys]).agg(",".join)
+    )
 
-    agg = pd.DataFrame(rows).reset_index(drop=True)
+    agg = pd.concat([tot, summed.reset_index()]).sort_values(keys, kind="stable").reset_index(drop=True)
 
     # Keep only the fields we truly need; drop any duplicate name columns coming from raw.
     base_cols = [
@@ -53,30 +42,31 @@ def main():
     agg = agg[base_cols]
 
     agg["season"] = agg["season_id"].str[:4].astype(int)
-    denom = (agg["fga"] + 0.44 * agg["fta"]).replace(0, pd.NA)
-    agg["ts_pct"] = agg["pts"] / (2 * denom)
-    agg["efg_pct"] = (agg["fgm"] + 0.5 * agg["fg3m"]) / agg["fga"].replace(0, pd.NA)
-    agg["mp_per_g"] = agg["min"] / agg["gp"].replace(0, pd.NA)
+    # Rate stats with Arrow compute kernels on float64 columns; a zero
+    # denominator becomes null (NaN once back in pandas).
+    t = pa.table({c: pa.array(agg[c], type=pa.float64()) for c in ["fgm", "fga", "fg3m", "fta", "gp", "min", "pts", "reb", "ast"]})
+
+    def ratio(num, den):
+        return pc.divide(num, pc.if_else(pc.equal(den, 0), None, den)).to_numpy(zero_copy_only=False)
+
+    agg["ts_pct"] = ratio(t["pts"], pc.multiply(2, pc.add(t["fga"], pc.multiply(0.44, t["fta"]))))
+    agg["efg_pct"] = ratio(pc.add(t["fgm"], pc.multiply(0.5, t["fg3m"])), t["fga"])
+    agg["mp_per_g"] = ratio(t["min"], t["gp"])
     for col in ["pts", "reb", "ast"]:
-        agg[f"{col}_per75"] = agg[col] / agg["min"].replace(0, pd.NA) * 75
+        agg[f"{col}_per75"] = ratio(t[col], t["min"]) * 75
 
     df = agg.merge(players[["player_id", "player_name", "position"]], on="player_id", how="left")
 
-    # simple annotations
-    df["annotation"] = None
-    for pid, g in df.groupby("player_id"):
-        ts_std = g["ts_pct"].std(ddof=0)
-        if ts_std is None or ts_std == 0 or pd.isna(ts_std):
-            # no variation; skip annotations
-            continue
-        z = (g["ts_pct"] - g["ts_pct"].mean()) / ts_std
-        msg = pd.Series([None]*len(g), index=g.index)
-        msg[z > 1.2] = "Elite efficiency year"
-        msg[z < -1.2] = "Rough efficiency year"
-        df.loc[g.index, "annotation"] = msg
+    # simple annotations: flag seasons whose TS% is far from the player's own
+    # average (players with no variation get none).
+    ts = df["ts_pct"]
+    by_player = ts.groupby(df["player_id"])
+    ts_std = by_player.transform("std", ddof=0)
+    z = (ts - by_player.transform("mean")) / ts_std.where(ts_std > 0)
+    df["annotation"] = np.select([z > 1.2, z < -1.2], ["Elite efficiency year", "Rough efficiency year"], default=None)
 
     Path("/Users/alexmackenzie/projects/nba-career-analytics/data/clean").mkdir(parents=True, exist_ok=True)
-    df.to_parquet("/Users/alexmackenzie/projects/nba-career-analytics/data/clean/player_seasons.parquet", index=False)
+    df.to_parquet("/Users/alexmackenzie/projects/nba-career-analytics/data/clean/player_seasons.parquet", index=False, compression="zstd")
     print("Wrote /Users/alexmackenzie/projects/nba-career-analytics/data/clean/player_seasons.parquet", df.shape)
 
 if __name__ == "__main__":
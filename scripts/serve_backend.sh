@@ -0,0 +1,19 @@
+#!/usr/bin/env sh
+# Launch the API for serving (run from the repo root).
+#
+# - uvloop replaces the asyncio event loop, httptools parses HTTP in C.
+# - One worker per core by default; override with WORKERS=N. The store is
+#   read-only after startup, so workers never need to coordinate.
+# - Each uvicorn worker builds its own Store. To build it once and share the
+#   pages copy-on-write, run gunicorn with --preload instead:
+#     gunicorn app.backend.main:app --preload -k uvicorn.workers.UvicornWorker -w "$WORKERS"
+set -eu
+
+WORKERS="${WORKERS:-$(nproc 2>/dev/null || sysctl -n hw.ncpu)}"
+
+exec uvicorn app.backend.main:app \
+  --host "${HOST:-0.0.0.0}" \
+  --port "${PORT:-8000}" \
+  --loop uvloop \
+  --http httptools \
+  --workers "$WORKERS"
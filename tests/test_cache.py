@@ -0,0 +1,43 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.backend.cache import cache, cached
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio client calls RedisCache makes."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, expire, value):
+        self.data[key] = value
+
+
+def test_version_bump_misses_cache(monkeypatch):
+    calls = []
+    app = FastAPI()
+
+    @app.get("/player/{player_id}/comps")
+    @cached("comps")
+    async def comps(player_id: int):
+        calls.append(player_id)
+        return [{"player_id": player_id, "calls": len(calls)}]
+
+    fake = FakeRedis()
+    monkeypatch.setattr(cache, "client", fake)
+    monkeypatch.setattr(cache, "version", "v1")
+    client = TestClient(app)
+
+    first = client.get("/player/1/comps").json()
+    assert client.get("/player/1/comps").json() == first
+    assert len(calls) == 1
+
+    cache.version = "v2"
+    assert client.get("/player/1/comps").json() == [{"player_id": 1, "calls": 2}]
+    assert len(calls) == 2
+    assert len(fake.data) == 2
+    assert all(key.startswith(("nba:v1:comps:", "nba:v2:comps:")) for key in fake.data)
@@ -0,0 +1,33 @@
+import orjson
+import pytest
+from pydantic import TypeAdapter
+
+from app.backend.schemas import ProjectionPoint, TrajectoryPoint
+from app.backend.store import store
+
+TrajectoryAdapter = TypeAdapter(list[TrajectoryPoint])
+ProjectionAdapter = TypeAdapter(list[ProjectionPoint])
+
+LEBRON = 2544  # long career with a 2024 season, so both payloads are non-empty
+UNKNOWN = 999999999
+
+
+@pytest.mark.parametrize(
+    "to_bytes, adapter",
+    [(store.trajectory_bytes, TrajectoryAdapter), (store.projection_bytes, ProjectionAdapter)],
+    ids=["trajectory", "projection"],
+)
+def test_bytes_match_response_schema(to_bytes, adapter):
+    # These bodies skip pydantic at serve time: they must parse into the
+    # response model and equal what response_model would have produced.
+    body = to_bytes(LEBRON)
+    points = adapter.validate_python(orjson.loads(body))
+    assert points
+    assert orjson.loads(adapter.dump_json(points)) == orjson.loads(body)
+
+
+@pytest.mark.parametrize("to_bytes", [store.trajectory_bytes, store.projection_bytes], ids=["trajectory", "projection"])
+def test_unknown_player_is_empty_and_not_memoized(to_bytes):
+    assert to_bytes(UNKNOWN) == b"[]"
+    assert UNKNOWN not in store._traj_json
+    assert UNKNOWN not in store._proj_json